@@ -9,24 +9,39 @@ Provides tools for Claude Code to interact with Databricks:
 - Monitor job logs
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
+import itertools
+import json
 import os
+import random
+import signal
 import sys
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
+
+import orjson
+from jsonschema import Draft202012Validator, ValidationError
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the default loop
+    uvloop = None
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.jobs import (
-    RunLifeCycleState,
-    RunResultState,
-    NotebookTask,
-    Task,
-    JobEnvironment,
-)
-from databricks.sdk.service.compute import Environment
+# The Databricks SDK takes the better part of a second to import, and importing
+# any of its service modules loads all of them. It is imported inside the
+# functions that use it so the server can answer initialize/list_tools first.
+if TYPE_CHECKING:
+    from databricks.sdk import WorkspaceClient
 
 # Initialize the MCP server
 server = Server("databricks")
@@ -54,40 +69,140 @@ def truncate_text(
         (text, metadata) - metadata is empty dict if no truncation occurred,
         otherwise contains truncation info for the agent.
     """
-    if not text or len(text) <= max_size:
+    if not text:
+        return text, {}
+
+    total_size = len(text)
+    if total_size <= max_size:
+        # Hand back the caller's string untouched - no copy
         return text, {}
 
-    truncated = text[:max_size]
     metadata = {
         f"{field_name}_truncated": True,
-        f"{field_name}_total_size": len(text),
+        f"{field_name}_total_size": total_size,
         f"{field_name}_shown_size": max_size,
     }
-    suffix = f"\n\n[... truncated, showing {max_size:,} of {len(text):,} chars]"
-    return truncated + suffix, metadata
+    suffix = f"\n\n[... truncated, showing {max_size:,} of {total_size:,} chars]"
+    return "".join((text[:max_size], suffix)), metadata
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Encode obj as compact JSON, stringifying non-string keys and SDK objects.
+
+    orjson rejects ints wider than 64 bits (e.g. DECIMAL(38,0) cells), so those
+    results go through the json module instead.
+    """
+    try:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def _approx_json_size(obj: Any, limit: int) -> int:
+    """
+    Estimate the JSON-encoded length of obj, giving up once it passes limit.
+
+    String escapes are not counted, so text full of quotes, backslashes or
+    control characters can encode larger than this. An estimate over limit
+    means obj doesn't fit; one under it still needs an exact measurement.
+    """
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            total += len(item) + 2
+        elif isinstance(item, dict):
+            total += 2 * len(item) + 2  # Braces, colons and commas
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            total += len(item) + 2
+            stack.extend(item)
+        else:
+            total += len(str(item))  # Numbers, booleans, null
+        if total > limit:
+            break
+    return total
+
+
+def _rows_within_size(rows: list, max_size: int) -> int:
+    """
+    Number of leading rows whose JSON encoding fits in max_size (0 if none do).
+
+    Rows are measured exactly, in characters like truncate_text, one at a time,
+    stopping at the first one that doesn't fit. The estimate is over the real size by at most a
+    character per non-empty container, so a row estimated at twice the remaining
+    space is rejected without serializing it.
+    """
+    total = 1  # Opening bracket
+    for count, row in enumerate(rows):
+        screen = 2 * (max_size - total)
+        if _approx_json_size(row, screen) > screen:
+            return count
+        total += len(_dumps(row)) + 1  # Comma
+        if total > max_size:
+            return count
+    return len(rows)
+
+# Workspace credentials, read once at startup (the server is launched with its env)
+DATABRICKS_HOST = os.environ.get("DATABRICKS_HOST")
+DATABRICKS_TOKEN = os.environ.get("DATABRICKS_TOKEN")
+
+# Worker threads for blocking SDK calls
+SDK_WORKER_THREADS = 32
+
+# Shared Databricks client, created on first use so its auth state and HTTP
+# connection pool are reused across tool calls
+_client: WorkspaceClient | None = None
+
 
 # Initialize Databricks client (uses DATABRICKS_HOST and DATABRICKS_TOKEN env vars)
 def get_client() -> WorkspaceClient:
-    """Get Databricks workspace client."""
-    host = os.environ.get("DATABRICKS_HOST")
-    token = os.environ.get("DATABRICKS_TOKEN")
-
-    if not host or not token:
+    """Get the shared Databricks workspace client, creating it on first use."""
+    global _client
+    # No lock needed: this only runs on the event loop thread and never awaits,
+    # so concurrent tool calls cannot interleave between the check and the set.
+    if _client is not None:
+        return _client
+
+    if not DATABRICKS_HOST or not DATABRICKS_TOKEN:
         raise ValueError("DATABRICKS_HOST and DATABRICKS_TOKEN environment variables must be set")
 
-    return WorkspaceClient(host=host, token=token)
+    from databricks.sdk import WorkspaceClient
+    from databricks.sdk.config import Config
+
+    # The SDK keeps 20 connections per host by default; match the worker thread
+    # count so concurrent calls reuse pooled connections instead of opening
+    # (and then discarding) new ones. Both settings are equal on purpose: SDK
+    # releases disagree on which of them maps to urllib3's pool_maxsize.
+    _client = WorkspaceClient(config=Config(
+        host=DATABRICKS_HOST,
+        token=DATABRICKS_TOKEN,
+        max_connection_pools=SDK_WORKER_THREADS,
+        max_connections_per_pool=SDK_WORKER_THREADS,
+    ))
+    return _client
 
 
 # ============================================================================
 # Tool Definitions
 # ============================================================================
 
-TOOLS = [
+class _ToolSpec(NamedTuple):
+    """Static tool definition; turned into an MCP Tool on first list_tools call."""
+    name: str
+    description: str
+    input_schema: dict
+
+
+_TOOL_SPECS: tuple[_ToolSpec, ...] = (
     # Notebook tools
-    Tool(
+    _ToolSpec(
         name="databricks_run_notebook",
         description="Run a Databricks notebook using serverless compute and return a run_id. Use databricks_get_run_output to get results.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "notebook_path": {
@@ -108,10 +223,10 @@ TOOLS = [
             "required": ["notebook_path"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_get_run_output",
         description="Get the output of a notebook run, including cell-by-cell results. Use after databricks_run_notebook.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "run_id": {
@@ -122,16 +237,22 @@ TOOLS = [
             "required": ["run_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_wait_for_run",
-        description="Wait for a notebook or job run to complete, polling until done.",
-        inputSchema={
+        description="Wait for a notebook or job run to complete, polling until done. Pass run_ids to wait on several runs at once.",
+        input_schema={
             "type": "object",
             "properties": {
                 "run_id": {
                     "type": "integer",
                     "description": "The run ID to wait for"
                 },
+                "run_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "minItems": 1,
+                    "description": "Several run IDs to wait for together, instead of run_id. Returns outputs keyed by run ID"
+                },
                 "timeout_minutes": {
                     "type": "integer",
                     "description": "Maximum time to wait in minutes (default: 30)",
@@ -139,17 +260,21 @@ TOOLS = [
                 },
                 "poll_interval_seconds": {
                     "type": "integer",
-                    "description": "Seconds between status checks (default: 10)",
-                    "default": 10
+                    "description": "Starting delay in seconds between status checks (the first check is immediate); it backs off exponentially, restarting from this interval whenever the run changes state (default: 2)",
+                    "default": 2
+                },
+                "max_poll_interval_seconds": {
+                    "type": "integer",
+                    "description": "Upper bound on the time between status checks (default: 30)",
+                    "default": 30
                 }
-            },
-            "required": ["run_id"]
+            }
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_read_notebook",
         description="Read the contents of a Databricks notebook (.py file with # COMMAND separators). Supports pagination for large notebooks.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "notebook_path": {
@@ -169,10 +294,10 @@ TOOLS = [
             "required": ["notebook_path"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_write_notebook",
         description="Write/update a Databricks notebook (.py file with # COMMAND separators).",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "notebook_path": {
@@ -192,10 +317,10 @@ TOOLS = [
             "required": ["notebook_path", "content"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_list_notebooks",
         description="List notebooks in a workspace directory. Returns up to 100 items by default with pagination support.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "path": {
@@ -216,10 +341,10 @@ TOOLS = [
             "required": ["path"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_update_notebook_cell",
         description="Update specific cell(s) in a Databricks notebook without rewriting the entire content. More efficient than databricks_write_notebook when making targeted changes.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "notebook_path": {
@@ -258,10 +383,10 @@ TOOLS = [
     ),
 
     # Job tools
-    Tool(
+    _ToolSpec(
         name="databricks_create_job",
         description="Create a Databricks job with notebook tasks using serverless compute.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "name": {
@@ -300,10 +425,10 @@ TOOLS = [
             "required": ["name", "tasks"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_run_job",
         description="Trigger a job run by job ID.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "job_id": {
@@ -319,10 +444,10 @@ TOOLS = [
             "required": ["job_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_get_job_run_status",
         description="Get the status and task states of a job run.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "run_id": {
@@ -333,10 +458,10 @@ TOOLS = [
             "required": ["run_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_get_run_logs",
         description="Get stdout/stderr logs from a run. Supports offset for reading large logs in chunks.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "run_id": {
@@ -357,10 +482,10 @@ TOOLS = [
             "required": ["run_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_list_jobs",
-        description="List jobs in the workspace.",
-        inputSchema={
+        description="List jobs in the workspace. Returns next_page_token when more jobs are available.",
+        input_schema={
             "type": "object",
             "properties": {
                 "name_filter": {
@@ -369,16 +494,22 @@ TOOLS = [
                 },
                 "limit": {
                     "type": "integer",
-                    "description": "Maximum number of jobs to return (default: 25)",
-                    "default": 25
+                    "description": "Maximum number of jobs to return (default: 25, max: 100)",
+                    "default": 25,
+                    "minimum": 1,
+                    "maximum": 100
+                },
+                "page_token": {
+                    "type": "string",
+                    "description": "next_page_token from a previous call, to fetch the following page"
                 }
             }
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_cancel_run",
         description="Cancel a running job or notebook run.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "run_id": {
@@ -391,10 +522,10 @@ TOOLS = [
     ),
 
     # Cluster tools
-    Tool(
+    _ToolSpec(
         name="databricks_list_clusters",
         description="List clusters in the workspace. Returns max 25 clusters by default to avoid large payloads.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "filter_by": {
@@ -406,14 +537,19 @@ TOOLS = [
                     "type": "integer",
                     "description": "Max clusters to return (default: 25, max: 100)",
                     "default": 25
+                },
+                "include_total": {
+                    "type": "boolean",
+                    "description": "Count every matching cluster and return total_matched; reads the full cluster list (default: false)",
+                    "default": False
                 }
             }
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_get_cluster_status",
         description="Get detailed status and information about a specific cluster.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_id": {
@@ -424,10 +560,10 @@ TOOLS = [
             "required": ["cluster_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_start_cluster",
         description="Start a terminated cluster and wait until running.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_id": {
@@ -448,10 +584,10 @@ TOOLS = [
             "required": ["cluster_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_stop_cluster",
         description="Stop/terminate a running cluster.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_id": {
@@ -462,10 +598,10 @@ TOOLS = [
             "required": ["cluster_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_create_cluster",
         description="Create a new cluster with Unity Catalog enabled. Defaults: Spark 17.3 LTS, m5.xlarge nodes, 120min auto-terminate, SINGLE_USER access mode.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_name": {
@@ -524,20 +660,20 @@ TOOLS = [
             "required": ["cluster_name"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_list_cluster_policies",
         description="List available cluster policies to find policy_id for cluster creation.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {}
         }
     ),
 
     # Interactive execution tools
-    Tool(
+    _ToolSpec(
         name="databricks_create_context",
-        description="Create an execution context on a running cluster for interactive code execution. Returns a context_id for use with databricks_execute_cell.",
-        inputSchema={
+        description="Create an execution context on a running cluster for interactive code execution. Returns a context_id for use with databricks_execute_cell. May reuse a previously released context (reused: true), in which case earlier variables can still be defined.",
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_id": {
@@ -553,10 +689,10 @@ TOOLS = [
             "required": ["cluster_id"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_execute_cell",
         description="Execute code in an execution context and get the output. Variables and state persist between calls.",
-        inputSchema={
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_id": {
@@ -578,17 +714,27 @@ TOOLS = [
                 },
                 "timeout_minutes": {
                     "type": "integer",
-                    "description": "Maximum execution time in minutes (default: 30)",
+                    "description": "Maximum execution time in minutes; the command is cancelled after this (default: 30)",
                     "default": 30
+                },
+                "include_schema": {
+                    "type": "boolean",
+                    "description": "Include the column schema of table results (default: false)",
+                    "default": False
+                },
+                "include_error_detail": {
+                    "type": "boolean",
+                    "description": "Include error_cause and error_summary when the command fails (default: true)",
+                    "default": True
                 }
             },
             "required": ["cluster_id", "context_id", "code"]
         }
     ),
-    Tool(
+    _ToolSpec(
         name="databricks_destroy_context",
-        description="Destroy an execution context when done with interactive execution.",
-        inputSchema={
+        description="Release an execution context when done with interactive execution. The context is kept idle for a while so databricks_create_context can reuse it; pass force=true to destroy it immediately. Refused while a command is still running in the context.",
+        input_schema={
             "type": "object",
             "properties": {
                 "cluster_id": {
@@ -598,87 +744,114 @@ TOOLS = [
                 "context_id": {
                     "type": "string",
                     "description": "The execution context ID to destroy"
+                },
+                "force": {
+                    "type": "boolean",
+                    "description": "Destroy the context now instead of keeping it idle for reuse by databricks_create_context (default: false)"
                 }
             },
             "required": ["cluster_id", "context_id"]
         }
     ),
-]
+)
+
+# Argument validators, compiled once per tool. call_tool runs these itself
+# instead of letting the MCP server rebuild a validator on every call.
+_VALIDATORS = MappingProxyType({
+    spec.name: Draft202012Validator(spec.input_schema) for spec in _TOOL_SPECS
+})
+
+
+@functools.cache
+def _tools() -> list[Tool]:
+    """Build the Tool models once; the tool set never changes."""
+    return [
+        Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+        for spec in _TOOL_SPECS
+    ]
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """Return the list of available tools."""
-    return TOOLS
+    return _tools()
 
 
 # ============================================================================
 # Tool Implementations
 # ============================================================================
 
-@server.call_tool()
+async def _run_tool(handler, arguments: dict[str, Any]) -> str:
+    """Run a handler and render its result as the tool's response text."""
+    client = get_client()
+    result = await handler(client, arguments)
+
+    if isinstance(result, str):
+        return result
+    # Compact JSON; non-string keys (e.g. truncated cell indices) and SDK
+    # objects are stringified
+    return _dumps(result)
+
+
+# Read-only calls currently running, keyed by tool name and canonical arguments;
+# each entry is [task, number of callers waiting on it]
+_inflight: dict[tuple[str, bytes], list] = {}
+
+
+async def _run_shared(name: str, handler, arguments: dict[str, Any]) -> str:
+    """Run a read-only tool, joining an identical call that is already in flight."""
+    try:
+        key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+    except TypeError:
+        # orjson can't encode the arguments (e.g. an int over 64 bits), so the
+        # call can't be matched against others; run it on its own
+        return await _run_tool(handler, arguments)
+    entry = _inflight.get(key)
+    if entry is None:
+        task = asyncio.ensure_future(_run_tool(handler, arguments))
+        entry = _inflight[key] = [task, 0]
+
+        def forget(_):
+            if _inflight.get(key) is entry:
+                del _inflight[key]
+
+        task.add_done_callback(forget)
+    task = entry[0]
+    entry[1] += 1
+    try:
+        # Shield so one caller being cancelled doesn't cancel the others' result
+        return await asyncio.shield(task)
+    finally:
+        entry[1] -= 1
+        if not entry[1] and not task.done():
+            # Every caller was cancelled; stop the call rather than leave it
+            # polling in the background
+            if _inflight.get(key) is entry:
+                del _inflight[key]
+            task.cancel()
+
+
+@server.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
 
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
     try:
-        client = get_client()
-
-        # Notebook tools
-        if name == "databricks_run_notebook":
-            result = await run_notebook(client, arguments)
-        elif name == "databricks_get_run_output":
-            result = await get_run_output(client, arguments)
-        elif name == "databricks_wait_for_run":
-            result = await wait_for_run(client, arguments)
-        elif name == "databricks_read_notebook":
-            result = await read_notebook(client, arguments)
-        elif name == "databricks_write_notebook":
-            result = await write_notebook(client, arguments)
-        elif name == "databricks_list_notebooks":
-            result = await list_notebooks(client, arguments)
-        elif name == "databricks_update_notebook_cell":
-            result = await update_notebook_cell(client, arguments)
-
-        # Job tools
-        elif name == "databricks_create_job":
-            result = await create_job(client, arguments)
-        elif name == "databricks_run_job":
-            result = await run_job(client, arguments)
-        elif name == "databricks_get_job_run_status":
-            result = await get_job_run_status(client, arguments)
-        elif name == "databricks_get_run_logs":
-            result = await get_run_logs(client, arguments)
-        elif name == "databricks_list_jobs":
-            result = await list_jobs(client, arguments)
-        elif name == "databricks_cancel_run":
-            result = await cancel_run(client, arguments)
-
-        # Cluster tools
-        elif name == "databricks_list_clusters":
-            result = await list_clusters(client, arguments)
-        elif name == "databricks_get_cluster_status":
-            result = await get_cluster_status(client, arguments)
-        elif name == "databricks_start_cluster":
-            result = await start_cluster(client, arguments)
-        elif name == "databricks_stop_cluster":
-            result = await stop_cluster(client, arguments)
-        elif name == "databricks_create_cluster":
-            result = await create_cluster(client, arguments)
-        elif name == "databricks_list_cluster_policies":
-            result = await list_cluster_policies(client, arguments)
-
-        # Interactive execution tools
-        elif name == "databricks_create_context":
-            result = await create_context(client, arguments)
-        elif name == "databricks_execute_cell":
-            result = await execute_cell(client, arguments)
-        elif name == "databricks_destroy_context":
-            result = await destroy_context(client, arguments)
+        _VALIDATORS[name].validate(arguments)
+    except ValidationError as e:
+        # Raised rather than returned so the decorator reports it as an error
+        # result (isError), as its own validation did
+        raise ValueError(f"Input validation error: {e.message}") from None
 
+    try:
+        if name in _SHAREABLE_TOOLS:
+            text = await _run_shared(name, handler, arguments)
         else:
-            result = f"Unknown tool: {name}"
-
-        return [TextContent(type="text", text=str(result))]
+            text = await _run_tool(handler, arguments)
+        return [TextContent(type="text", text=text)]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {type(e).__name__}: {str(e)}")]
@@ -688,8 +861,15 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 # Notebook Tool Implementations
 # ============================================================================
 
+# Seconds to wait after submitting a run before checking whether it already finished
+SUBMIT_RECHECK_DELAY = 0.2
+
+
 async def run_notebook(client: WorkspaceClient, args: dict) -> dict:
     """Run a notebook using serverless compute."""
+    from databricks.sdk.service.compute import Environment
+    from databricks.sdk.service.jobs import JobEnvironment, NotebookTask, Task
+
     notebook_path = args["notebook_path"]
     parameters = args.get("parameters", {})
     timeout_minutes = args.get("timeout_minutes", 30)
@@ -697,7 +877,8 @@ async def run_notebook(client: WorkspaceClient, args: dict) -> dict:
     # Use serverless compute with environment version
     # Environment version "2" is the current serverless Python environment
     environment_key = "serverless_env"
-    run = client.jobs.submit(
+    run = await asyncio.to_thread(
+        client.jobs.submit,
         run_name=f"Claude Code: {notebook_path.split('/')[-1]}",
         tasks=[
             Task(
@@ -718,9 +899,24 @@ async def run_notebook(client: WorkspaceClient, args: dict) -> dict:
         ]
     )
 
+    run_id = run.run_id
+
+    # Runs that fail validation (e.g. a missing notebook) finish almost at once;
+    # check once so those come back now instead of on the next tool call
+    try:
+        await asyncio.sleep(SUBMIT_RECHECK_DELAY)
+        run = await asyncio.to_thread(client.jobs.get_run, run_id=run_id)
+        if _life_cycle_state(run) in TERMINAL_RUN_STATES:
+            output = await asyncio.to_thread(client.jobs.get_run_output, run_id=run_id)
+            result = _build_output_result(run_id, run, output)
+            result["completed_inline"] = True
+            return result
+    except Exception:
+        pass  # The run exists regardless; don't lose its run_id over the recheck
+
     return {
-        "run_id": run.run_id,
-        "message": f"Notebook run submitted. Use databricks_wait_for_run or databricks_get_run_output with run_id={run.run_id}"
+        "run_id": run_id,
+        "message": f"Notebook run submitted. Use databricks_wait_for_run or databricks_get_run_output with run_id={run_id}"
     }
 
 
@@ -728,23 +924,23 @@ async def get_run_output(client: WorkspaceClient, args: dict) -> dict:
     """Get the output of a run including notebook cell outputs."""
     run_id = args["run_id"]
 
-    # Get run details
-    run = client.jobs.get_run(run_id=run_id)
+    # Run details and run output are independent requests; issue them concurrently
+    run, output = await asyncio.gather(
+        asyncio.to_thread(client.jobs.get_run, run_id=run_id),
+        asyncio.to_thread(client.jobs.get_run_output, run_id=run_id),
+    )
+    return _build_output_result(run_id, run, output)
 
-    # Get run output
-    output = client.jobs.get_run_output(run_id=run_id)
 
-    result = {
-        "run_id": run_id,
-        "state": run.state.life_cycle_state.value if run.state else "UNKNOWN",
-        "result_state": run.state.result_state.value if run.state and run.state.result_state else None,
-        "state_message": run.state.state_message if run.state else None,
-    }
+def _build_output_result(run_id: int, run, output) -> dict:
+    """Summarize a run and its output for get_run_output and wait_for_run."""
+    result = {"run_id": run_id, **_state_fields(run.state)}
 
-    # Parse notebook output if available (with truncation)
+    # Parse notebook output if available (with truncation). The length checks
+    # skip truncate_text for the common case of output under the limit.
     if output.notebook_output:
         nb_result = output.notebook_output.result
-        if nb_result:
+        if nb_result and len(nb_result) > MAX_TEXT_SIZE:
             nb_result, nb_meta = truncate_text(nb_result, MAX_TEXT_SIZE, "notebook_result")
             result.update(nb_meta)
 
@@ -757,95 +953,227 @@ async def get_run_output(client: WorkspaceClient, args: dict) -> dict:
     if output.error:
         result["error"] = output.error
 
-    if output.error_trace:
-        error_trace, trace_meta = truncate_text(output.error_trace, MAX_TEXT_SIZE, "error_trace")
-        result["error_trace"] = error_trace
-        result.update(trace_meta)
+    error_trace = output.error_trace
+    if error_trace:
+        if len(error_trace) > MAX_TEXT_SIZE:
+            result["error_trace"], trace_meta = truncate_text(error_trace, MAX_TEXT_SIZE, "error_trace")
+            result.update(trace_meta)
+        else:
+            result["error_trace"] = error_trace
 
     # Include logs if available (with truncation)
-    if output.logs:
-        logs, logs_meta = truncate_text(output.logs, MAX_LOG_SIZE, "logs")
-        result["logs"] = logs
-        result.update(logs_meta)
+    logs = output.logs
+    if logs:
+        if len(logs) > MAX_LOG_SIZE:
+            result["logs"], logs_meta = truncate_text(logs, MAX_LOG_SIZE, "logs")
+            result.update(logs_meta)
+        else:
+            result["logs"] = logs
 
     return result
 
 
-async def wait_for_run(client: WorkspaceClient, args: dict) -> dict:
-    """Wait for a run to complete."""
-    run_id = args["run_id"]
-    timeout_minutes = args.get("timeout_minutes", 30)
-    poll_interval = args.get("poll_interval_seconds", 10)
+# Run life-cycle states after which a run will not change again
+TERMINAL_RUN_STATES = frozenset({"TERMINATED", "SKIPPED", "INTERNAL_ERROR"})
+
+
+def _life_cycle_state(run) -> str | None:
+    """Return a run's life-cycle state name, or None if it isn't reported."""
+    state = run.state
+    if state and state.life_cycle_state:
+        return state.life_cycle_state.value
+    return None
 
-    max_iterations = (timeout_minutes * 60) // poll_interval
-    iteration = 0
 
-    terminal_states = {
-        RunLifeCycleState.TERMINATED,
-        RunLifeCycleState.SKIPPED,
-        RunLifeCycleState.INTERNAL_ERROR
+def _state_fields(state) -> dict:
+    """Return the state, result_state and state_message fields for a run's state."""
+    if state is None:
+        return {"state": "UNKNOWN", "result_state": None, "state_message": None}
+    life_cycle_state = state.life_cycle_state
+    result_state = state.result_state
+    return {
+        "state": life_cycle_state.value if life_cycle_state else "UNKNOWN",
+        "result_state": result_state.value if result_state else None,
+        "state_message": state.state_message,
     }
 
-    while iteration < max_iterations:
-        run = client.jobs.get_run(run_id=run_id)
-        state = run.state
 
-        if state and state.life_cycle_state in terminal_states:
-            # Run completed, get output
-            output_result = await get_run_output(client, {"run_id": run_id})
-            return output_result
+# Polling backoff for long-running waits
+POLL_BACKOFF_FACTOR = 1.5
+MAX_POLL_INTERVAL = 30       # Seconds between status checks, upper bound
 
-        iteration += 1
-        await asyncio.sleep(poll_interval)
 
-    return {
-        "run_id": run_id,
-        "status": "TIMEOUT",
-        "message": f"Run did not complete within {timeout_minutes} minutes"
+def _next_poll_delay(delay: float, cap: float = MAX_POLL_INTERVAL) -> float:
+    """Grow a polling delay exponentially up to cap, with +/-10% jitter."""
+    return min(cap, delay * POLL_BACKOFF_FACTOR) * random.uniform(0.9, 1.1)
+
+
+async def wait_for_run(client: WorkspaceClient, args: dict) -> dict:
+    """Wait for one or more runs to complete, backing off between status checks."""
+    run_ids = args.get("run_ids")
+    if run_ids is None:
+        if "run_id" not in args:
+            return {"status": "error", "message": "Provide run_id or run_ids"}
+        run_ids = [args["run_id"]]
+    timeout_minutes = args.get("timeout_minutes", 30)
+    initial_delay = args.get("poll_interval_seconds", 2)
+    max_delay = args.get("max_poll_interval_seconds", MAX_POLL_INTERVAL)
+    delay = initial_delay
+
+    # Measure against the loop clock so time spent in get_run counts too
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_minutes * 60
+
+    # Unfinished run_id -> life-cycle state seen on the previous check
+    pending = dict.fromkeys(run_ids)
+    outputs = {}
+    while True:
+        # One concurrent status check per pending run per tick
+        runs = await asyncio.gather(*(
+            asyncio.to_thread(client.jobs.get_run, run_id=run_id) for run_id in pending
+        ))
+
+        finished = []
+        changed = False
+        for run_id, run in zip(list(pending), runs):
+            life_cycle_state = _life_cycle_state(run)
+            if life_cycle_state in TERMINAL_RUN_STATES:
+                finished.append((run_id, run))
+            elif pending[run_id] is not None and life_cycle_state != pending[run_id]:
+                changed = True
+            pending[run_id] = life_cycle_state
+
+        if finished:
+            # Runs completed, get their output; the run details polled just now
+            # are already terminal, so only the output needs fetching
+            run_outputs = await asyncio.gather(*(
+                asyncio.to_thread(client.jobs.get_run_output, run_id=run_id) for run_id, _ in finished
+            ))
+            for (run_id, run), output in zip(finished, run_outputs):
+                outputs[run_id] = _build_output_result(run_id, run, output)
+                del pending[run_id]
+            changed = True
+
+        if not pending:
+            break
+
+        # A transition (e.g. PENDING -> RUNNING) often precedes another one
+        # soon, so poll quickly again instead of continuing to back off
+        if changed:
+            delay = initial_delay
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        delay = _next_poll_delay(delay, max_delay)
+
+    if "run_ids" not in args:
+        run_id = run_ids[0]
+        if run_id in outputs:
+            return outputs[run_id]
+        return {
+            "run_id": run_id,
+            "status": "TIMEOUT",
+            "message": f"Run did not complete within {timeout_minutes} minutes"
+        }
+
+    result = {
+        "runs": {run_id: outputs[run_id] for run_id in run_ids if run_id in outputs},
+        "completed": len(outputs),
+        "pending": list(pending)
     }
+    if pending:
+        result["status"] = "TIMEOUT"
+        result["message"] = f"{len(pending)} of {len(outputs) + len(pending)} runs did not complete within {timeout_minutes} minutes"
+    return result
 
 
-async def read_notebook(client: WorkspaceClient, args: dict) -> dict:
-    """Read notebook content from workspace with optional pagination."""
-    import base64
+def _download_source(client: WorkspaceClient, path: str) -> str:
+    """Download and decode a notebook's SOURCE export (blocking; run in a worker thread)."""
     from databricks.sdk.service.workspace import ExportFormat
 
+    with client.workspace.download(path, format=ExportFormat.SOURCE) as source:
+        return source.read().decode("utf-8")
+
+
+def _upload_source(client: WorkspaceClient, path: str, content: str, overwrite: bool) -> None:
+    """Upload a Python notebook's source (blocking; run in a worker thread)."""
+    from databricks.sdk.service.workspace import ImportFormat, Language
+
+    # upload() sends the bytes as a multipart file, so no base64 copy of the notebook is built
+    client.workspace.upload(
+        path,
+        content.encode("utf-8"),
+        format=ImportFormat.SOURCE,
+        language=Language.PYTHON,
+        overwrite=overwrite
+    )
+
+
+# Recently downloaded notebook sources: path -> (modified_at, source), LRU order
+NOTEBOOK_CACHE_SIZE = 64
+_notebook_sources: OrderedDict[str, tuple[int, str]] = OrderedDict()
+
+
+async def _read_source(client: WorkspaceClient, path: str) -> str:
+    """Return a notebook's source, reusing the cached copy if it hasn't been modified since."""
+    # get_status is a small metadata call; the export it can save is the whole notebook
+    status = await asyncio.to_thread(client.workspace.get_status, path=path)
+    modified_at = status.modified_at
+
+    cached = _notebook_sources.get(path)
+    if cached is not None and modified_at is not None and cached[0] == modified_at:
+        _notebook_sources.move_to_end(path)
+        return cached[1]
+
+    # Downloaded after get_status, so the copy is at least as new as modified_at
+    content = await asyncio.to_thread(_download_source, client, path)
+    if modified_at is not None:
+        _notebook_sources[path] = (modified_at, content)
+        _notebook_sources.move_to_end(path)
+        if len(_notebook_sources) > NOTEBOOK_CACHE_SIZE:
+            _notebook_sources.popitem(last=False)
+    return content
+
+
+async def read_notebook(client: WorkspaceClient, args: dict) -> dict:
+    """Read notebook content from workspace with optional pagination."""
     notebook_path = args["notebook_path"]
     cell_offset = args.get("cell_offset", 0)
     cell_limit = args.get("cell_limit")  # None means all cells
 
-    # Export notebook as SOURCE format (Python)
-    export = client.workspace.export(path=notebook_path, format=ExportFormat.SOURCE)
-
-    # Decode content
-    content = base64.b64decode(export.content).decode("utf-8")
+    # Stream the raw SOURCE export (Python) rather than a base64-encoded JSON payload.
+    # The whole source is still needed: total_cells and offsets span every cell.
+    content = await _read_source(client, notebook_path)
 
-    # Parse cells (split by # COMMAND ----------)
-    all_cells = _parse_notebook_cells(content)
-    total_cells = len(all_cells)
+    # Locate cells (split by # COMMAND ----------), but only copy out the ones
+    # being returned; the offsets alone give total_cells
+    spans = list(_cell_spans(content))
+    total_cells = len(spans)
 
     # Apply pagination
     if cell_limit is not None:
-        cells_to_return = all_cells[cell_offset:cell_offset + cell_limit]
+        page = spans[cell_offset:cell_offset + cell_limit]
     else:
-        cells_to_return = all_cells[cell_offset:]
-
-    # Truncate individual cells if they're too large, with metadata
-    cells_output = []
-    truncation_info = {}
-
-    for i, cell in enumerate(cells_to_return):
-        actual_index = cell_offset + i
-        if len(cell) > MAX_CELL_CONTENT:
-            truncated_cell, _ = truncate_text(cell, MAX_CELL_CONTENT, "cell")
-            cells_output.append(truncated_cell)
-            truncation_info[actual_index] = {
-                "truncated": True,
-                "total_size": len(cell),
-                "shown_size": MAX_CELL_CONTENT
-            }
-        else:
-            cells_output.append(cell)
+        page = spans[cell_offset:]
+
+    # Truncate individual cells if they're too large, with metadata. Sizes come
+    # from the offsets, so only oversized cells reach truncate_text.
+    cells_output = [
+        content[start:end] if end - start <= MAX_CELL_CONTENT
+        else truncate_text(content[start:end], MAX_CELL_CONTENT, "cell")[0]
+        for start, end in page
+    ]
+    truncation_info = {
+        index: {
+            "truncated": True,
+            "total_size": end - start,
+            "shown_size": MAX_CELL_CONTENT
+        }
+        for index, (start, end) in enumerate(page, start=cell_offset)
+        if end - start > MAX_CELL_CONTENT
+    }
 
     result = {
         "path": notebook_path,
@@ -870,24 +1198,14 @@ async def read_notebook(client: WorkspaceClient, args: dict) -> dict:
 
 async def write_notebook(client: WorkspaceClient, args: dict) -> dict:
     """Write notebook content to workspace."""
-    import base64
-    from databricks.sdk.service.workspace import ImportFormat, Language
-
     notebook_path = args["notebook_path"]
     content = args["content"]
     overwrite = args.get("overwrite", True)
 
-    # Encode content
-    encoded_content = base64.b64encode(content.encode("utf-8")).decode("utf-8")
-
     # Import notebook
-    client.workspace.import_(
-        path=notebook_path,
-        content=encoded_content,
-        format=ImportFormat.SOURCE,
-        language=Language.PYTHON,
-        overwrite=overwrite
-    )
+    await asyncio.to_thread(_upload_source, client, notebook_path, content, overwrite)
+    # The new modified_at isn't known, so the next read has to download
+    _notebook_sources.pop(notebook_path, None)
 
     return {
         "path": notebook_path,
@@ -902,21 +1220,20 @@ async def list_notebooks(client: WorkspaceClient, args: dict) -> dict:
     limit = args.get("limit", MAX_LIST_ITEMS)
     offset = args.get("offset", 0)
 
-    items = client.workspace.list(path=path)
+    # The directory comes back in a single response (the API doesn't paginate),
+    # so total_count is free; only the requested page is converted
+    items = await asyncio.to_thread(lambda: list(client.workspace.list(path=path)))
+    total_count = len(items)
 
-    # Collect all items first (API doesn't support pagination directly)
-    all_items = []
-    for item in items:
-        all_items.append({
+    # Apply pagination
+    paginated_items = [
+        {
             "path": item.path,
             "type": item.object_type.value if item.object_type else "UNKNOWN",
             "language": item.language.value if item.language else None
-        })
-
-    total_count = len(all_items)
-
-    # Apply pagination
-    paginated_items = all_items[offset:offset + limit]
+        }
+        for item in items[offset:offset + limit]
+    ]
 
     result = {
         "path": path,
@@ -938,23 +1255,37 @@ async def list_notebooks(client: WorkspaceClient, args: dict) -> dict:
 CELL_SEPARATOR = "# COMMAND ----------"
 
 
-def _parse_notebook_cells(content: str) -> list[str]:
-    """Parse notebook content into cells."""
-    cells = []
-    current_cell = []
-
-    for line in content.split("\n"):
-        if line.strip().startswith("# COMMAND ----------"):
-            if current_cell:
-                cells.append("\n".join(current_cell))
-                current_cell = []
-        else:
-            current_cell.append(line)
+def _separator_lines(content: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of lines that begin with CELL_SEPARATOR after leading whitespace."""
+    # str.find scans in C, so only separator candidates reach Python
+    pos = 0
+    while (hit := content.find(CELL_SEPARATOR, pos)) != -1:
+        start = content.rfind("\n", 0, hit) + 1
+        end = content.find("\n", hit)
+        if end == -1:
+            end = len(content)
+        if start == hit or content[start:hit].isspace():
+            yield start, end
+        pos = end
 
-    if current_cell:
-        cells.append("\n".join(current_cell))
 
-    return cells
+def _cell_spans(content: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of each cell's text in content."""
+    cell_start = 0
+    for start, end in _separator_lines(content):
+        # Skip empty spans (separator at the top or two separators in a row);
+        # otherwise the cell ends before the newline preceding the separator
+        if start > cell_start:
+            yield cell_start, start - 1
+        cell_start = end + 1
+
+    if cell_start <= len(content):
+        yield cell_start, len(content)
+
+
+def _parse_notebook_cells(content: str) -> list[str]:
+    """Parse notebook content into cells."""
+    return [content[start:end] for start, end in _cell_spans(content)]
 
 
 def _reconstruct_notebook(cells: list[str]) -> str:
@@ -964,16 +1295,13 @@ def _reconstruct_notebook(cells: list[str]) -> str:
 
 def _validate_cell_content(content: str) -> tuple[bool, str]:
     """Validate cell content doesn't contain cell separators."""
-    if "# COMMAND ----------" in content or ("# COMMAND" in content and "----------" in content):
+    if next(_separator_lines(content), None) is not None:
         return False, "Cell content cannot contain '# COMMAND ----------' separator - this would corrupt notebook structure"
     return True, ""
 
 
 async def update_notebook_cell(client: WorkspaceClient, args: dict) -> dict:
     """Update specific cell(s) in a notebook without rewriting entire content."""
-    import base64
-    from databricks.sdk.service.workspace import ImportFormat, Language, ExportFormat
-
     notebook_path = args["notebook_path"]
     cell_index = args.get("cell_index")
     new_content = args.get("new_content")
@@ -1002,8 +1330,7 @@ async def update_notebook_cell(client: WorkspaceClient, args: dict) -> dict:
         }
 
     # Read existing notebook
-    export = client.workspace.export(path=notebook_path, format=ExportFormat.SOURCE)
-    content = base64.b64decode(export.content).decode("utf-8")
+    content = await _read_source(client, notebook_path)
     cells = _parse_notebook_cells(content)
 
     # Build updates list
@@ -1012,16 +1339,19 @@ async def update_notebook_cell(client: WorkspaceClient, args: dict) -> dict:
     else:
         updates_to_apply = updates
 
-    # Validate all updates
+    # Validate and apply updates in one pass. cells is a local copy and nothing
+    # is written until every update has passed, so an error needs no rollback.
+    cell_count = len(cells)
+    updated_indices = []
     for update in updates_to_apply:
         idx = update["index"]
         cell_content = update["content"]
 
         # Bounds check
-        if idx < 0 or idx >= len(cells):
+        if idx < 0 or idx >= cell_count:
             return {
                 "status": "error",
-                "message": f"Cell index {idx} out of bounds (notebook has {len(cells)} cells, indices 0-{len(cells)-1})"
+                "message": f"Cell index {idx} out of bounds (notebook has {cell_count} cells, indices 0-{cell_count-1})"
             }
 
         # Separator injection check
@@ -1032,24 +1362,13 @@ async def update_notebook_cell(client: WorkspaceClient, args: dict) -> dict:
                 "message": f"Invalid content for cell {idx}: {error_msg}"
             }
 
-    # Apply updates
-    updated_indices = []
-    for update in updates_to_apply:
-        idx = update["index"]
-        cells[idx] = update["content"]
+        cells[idx] = cell_content
         updated_indices.append(idx)
 
     # Reconstruct and write notebook
     new_notebook_content = _reconstruct_notebook(cells)
-    encoded_content = base64.b64encode(new_notebook_content.encode("utf-8")).decode("utf-8")
-
-    client.workspace.import_(
-        path=notebook_path,
-        content=encoded_content,
-        format=ImportFormat.SOURCE,
-        language=Language.PYTHON,
-        overwrite=True
-    )
+    await asyncio.to_thread(_upload_source, client, notebook_path, new_notebook_content, True)
+    _notebook_sources.pop(notebook_path, None)
 
     return {
         "path": notebook_path,
@@ -1066,7 +1385,8 @@ async def update_notebook_cell(client: WorkspaceClient, args: dict) -> dict:
 
 async def create_job(client: WorkspaceClient, args: dict) -> dict:
     """Create a job with notebook tasks using serverless compute."""
-    from databricks.sdk.service.jobs import TaskDependency
+    from databricks.sdk.service.compute import Environment
+    from databricks.sdk.service.jobs import JobEnvironment, NotebookTask, Task, TaskDependency
 
     name = args["name"]
     task_configs = args["tasks"]
@@ -1093,7 +1413,8 @@ async def create_job(client: WorkspaceClient, args: dict) -> dict:
         tasks.append(task)
 
     # Create job with serverless environment (version "2" is current)
-    job = client.jobs.create(
+    job = await asyncio.to_thread(
+        client.jobs.create,
         name=name,
         tasks=tasks,
         environments=[
@@ -1117,7 +1438,8 @@ async def run_job(client: WorkspaceClient, args: dict) -> dict:
     job_id = args["job_id"]
     parameters = args.get("parameters")
 
-    run = client.jobs.run_now(
+    run = await asyncio.to_thread(
+        client.jobs.run_now,
         job_id=job_id,
         notebook_params=parameters
     )
@@ -1133,24 +1455,19 @@ async def get_job_run_status(client: WorkspaceClient, args: dict) -> dict:
     """Get job run status with task details."""
     run_id = args["run_id"]
 
-    run = client.jobs.get_run(run_id=run_id)
+    run = await asyncio.to_thread(client.jobs.get_run, run_id=run_id)
 
-    result = {
-        "run_id": run_id,
-        "job_id": run.job_id,
-        "state": run.state.life_cycle_state.value if run.state else "UNKNOWN",
-        "result_state": run.state.result_state.value if run.state and run.state.result_state else None,
-        "state_message": run.state.state_message if run.state else None,
-    }
+    result = {"run_id": run_id, "job_id": run.job_id, **_state_fields(run.state)}
 
     # Include task states if this is a multi-task job
     if run.tasks:
         result["tasks"] = []
         for task in run.tasks:
+            task_state = task.state
             task_info = {
                 "task_key": task.task_key,
-                "state": task.state.life_cycle_state.value if task.state else "UNKNOWN",
-                "result_state": task.state.result_state.value if task.state and task.state.result_state else None,
+                "state": task_state.life_cycle_state.value if task_state else "UNKNOWN",
+                "result_state": task_state.result_state.value if task_state and task_state.result_state else None,
             }
             if task.run_id:
                 task_info["run_id"] = task.run_id
@@ -1166,20 +1483,21 @@ async def get_run_logs(client: WorkspaceClient, args: dict) -> dict:
     max_size = args.get("max_size", MAX_LOG_SIZE)
 
     # Get run output which includes logs
-    output = client.jobs.get_run_output(run_id=run_id)
+    output = await asyncio.to_thread(client.jobs.get_run_output, run_id=run_id)
 
-    logs = output.logs if output.logs else ""
-    total_size = len(logs)
+    all_logs = output.logs if output.logs else ""
+    total_size = len(all_logs)
 
-    # Apply offset and size limit
-    if offset > 0:
-        logs = logs[offset:]
+    # Apply offset and size limit in one slice, so only the window is copied
+    start = offset if offset > 0 else 0
+    logs = all_logs[start:start + max_size]
 
-    logs_truncated_by_us = False
-    if len(logs) > max_size:
-        logs = logs[:max_size]
-        logs_truncated_by_us = True
-        logs += f"\n\n[... truncated, showing {max_size:,} chars starting at offset {offset}. Total size: {total_size:,} chars]"
+    logs_truncated_by_us = total_size - start > max_size
+    if logs_truncated_by_us:
+        logs = "".join((
+            logs,
+            f"\n\n[... truncated, showing {max_size:,} chars starting at offset {offset}. Total size: {total_size:,} chars]",
+        ))
 
     result = {
         "run_id": run_id,
@@ -1198,10 +1516,13 @@ async def get_run_logs(client: WorkspaceClient, args: dict) -> dict:
     if output.error:
         result["error"] = output.error
 
-    if output.error_trace:
-        error_trace, trace_meta = truncate_text(output.error_trace, MAX_TEXT_SIZE, "error_trace")
-        result["error_trace"] = error_trace
-        result.update(trace_meta)
+    error_trace = output.error_trace
+    if error_trace:
+        if len(error_trace) > MAX_TEXT_SIZE:
+            result["error_trace"], trace_meta = truncate_text(error_trace, MAX_TEXT_SIZE, "error_trace")
+            result.update(trace_meta)
+        else:
+            result["error_trace"] = error_trace
 
     return result
 
@@ -1210,28 +1531,40 @@ async def list_jobs(client: WorkspaceClient, args: dict) -> dict:
     """List jobs in the workspace."""
     name_filter = args.get("name_filter")
     limit = args.get("limit", 25)
+    page_token = args.get("page_token")
+
+    # jobs.list() follows next_page_token until the workspace is exhausted and
+    # never exposes it, so fetch exactly one page and hand the cursor back.
+    query = {"limit": limit}
+    if name_filter:
+        query["name"] = name_filter
+    if page_token:
+        query["page_token"] = page_token
+    page = await asyncio.to_thread(client.api_client.do, "GET", "/api/2.1/jobs/list", query=query)
+
+    jobs = [
+        {
+            "job_id": job.get("job_id"),
+            "name": job.get("settings", {}).get("name", "Unknown"),
+            "created_time": job.get("created_time")
+        }
+        for job in page.get("jobs", [])
+    ]
 
-    jobs_list = client.jobs.list(name=name_filter, limit=limit)
-
-    jobs = []
-    for job in jobs_list:
-        jobs.append({
-            "job_id": job.job_id,
-            "name": job.settings.name if job.settings else "Unknown",
-            "created_time": job.created_time
-        })
-
-    return {
+    result = {
         "jobs": jobs,
         "count": len(jobs)
     }
+    if page.get("next_page_token"):
+        result["next_page_token"] = page["next_page_token"]
+    return result
 
 
 async def cancel_run(client: WorkspaceClient, args: dict) -> dict:
     """Cancel a run."""
     run_id = args["run_id"]
 
-    client.jobs.cancel_run(run_id=run_id)
+    await asyncio.to_thread(client.jobs.cancel_run, run_id=run_id)
 
     return {
         "run_id": run_id,
@@ -1248,39 +1581,48 @@ async def list_clusters(client: WorkspaceClient, args: dict) -> dict:
     """List clusters in the workspace with truncation to avoid large payloads."""
     filter_by = args.get("filter_by", "all")
     limit = min(args.get("limit", 25), 100)  # Default 25, max 100
-    clusters_iter = client.clusters.list()
-
-    clusters = []
-    total_matched = 0
-    for cluster in clusters_iter:
-        state = cluster.state.value if cluster.state else "UNKNOWN"
-
-        # Apply filter (compare strings)
-        if filter_by == "running" and state != "RUNNING":
-            continue
-        if filter_by == "terminated" and state != "TERMINATED":
-            continue
-
-        total_matched += 1
-        if len(clusters) < limit:
-            clusters.append({
-                "cluster_id": cluster.cluster_id,
-                "cluster_name": cluster.cluster_name,
-                "state": state,
-                "spark_version": cluster.spark_version,
-                "node_type_id": cluster.node_type_id,
-                "num_workers": cluster.num_workers,
-                "creator": cluster.creator_user_name,
-            })
+    include_total = args.get("include_total", False)
+    wanted_state = {"running": "RUNNING", "terminated": "TERMINATED"}.get(filter_by)
+
+    def collect() -> tuple[list, int | None]:
+        # The listing fetches pages as it is iterated, so stop pulling once one
+        # match beyond the limit shows there are more, unless a total is wanted
+        matched = (
+            cluster for cluster in client.clusters.list()
+            if wanted_state is None or (cluster.state and cluster.state.value) == wanted_state
+        )
+        if include_total:
+            matched = list(matched)
+            return matched[:limit + 1], len(matched)
+        return list(itertools.islice(matched, limit + 1)), None
+
+    page, total_matched = await asyncio.to_thread(collect)
+
+    clusters = [
+        {
+            "cluster_id": cluster.cluster_id,
+            "cluster_name": cluster.cluster_name,
+            "state": cluster.state.value if cluster.state else "UNKNOWN",
+            "spark_version": cluster.spark_version,
+            "node_type_id": cluster.node_type_id,
+            "num_workers": cluster.num_workers,
+            "creator": cluster.creator_user_name,
+        }
+        for cluster in page[:limit]
+    ]
 
     result = {
         "clusters": clusters,
         "returned": len(clusters),
-        "total_matched": total_matched,
     }
-    if total_matched > limit:
+    if total_matched is not None:
+        result["total_matched"] = total_matched
+    if len(page) > limit:
         result["truncated"] = True
-        result["message"] = f"Showing {limit} of {total_matched} clusters. Use filter_by or increase limit (max 100) to see more."
+        if total_matched is not None:
+            result["message"] = f"Showing {limit} of {total_matched} clusters. Use filter_by or increase limit (max 100) to see more."
+        else:
+            result["message"] = f"Showing the first {limit} matching clusters. Use filter_by or increase limit (max 100) to see more, or include_total to count them."
 
     return result
 
@@ -1288,7 +1630,7 @@ async def list_clusters(client: WorkspaceClient, args: dict) -> dict:
 async def get_cluster_status(client: WorkspaceClient, args: dict) -> dict:
     """Get detailed cluster status."""
     cluster_id = args["cluster_id"]
-    cluster = client.clusters.get(cluster_id=cluster_id)
+    cluster = await asyncio.to_thread(client.clusters.get, cluster_id=cluster_id)
 
     return {
         "cluster_id": cluster.cluster_id,
@@ -1308,14 +1650,12 @@ async def get_cluster_status(client: WorkspaceClient, args: dict) -> dict:
 
 async def start_cluster(client: WorkspaceClient, args: dict) -> dict:
     """Start a terminated cluster, optionally waiting for it to be running."""
-    from datetime import timedelta
-
     cluster_id = args["cluster_id"]
     wait = args.get("wait", True)
     timeout_minutes = args.get("timeout_minutes", 20)
 
     # Check current state first
-    cluster = client.clusters.get(cluster_id=cluster_id)
+    cluster = await asyncio.to_thread(client.clusters.get, cluster_id=cluster_id)
     if cluster.state and cluster.state.value == "RUNNING":
         return {
             "cluster_id": cluster_id,
@@ -1327,7 +1667,8 @@ async def start_cluster(client: WorkspaceClient, args: dict) -> dict:
 
     if wait:
         # Start the cluster and wait for it to be running
-        cluster = client.clusters.start_and_wait(
+        cluster = await asyncio.to_thread(
+            client.clusters.start_and_wait,
             cluster_id=cluster_id,
             timeout=timedelta(minutes=timeout_minutes)
         )
@@ -1340,7 +1681,7 @@ async def start_cluster(client: WorkspaceClient, args: dict) -> dict:
         }
     else:
         # Start without waiting
-        client.clusters.start(cluster_id=cluster_id)
+        await asyncio.to_thread(client.clusters.start, cluster_id=cluster_id)
         return {
             "cluster_id": cluster_id,
             "cluster_name": cluster.cluster_name,
@@ -1355,12 +1696,12 @@ async def stop_cluster(client: WorkspaceClient, args: dict) -> dict:
     cluster_id = args["cluster_id"]
 
     # Get cluster info before terminating
-    cluster = client.clusters.get(cluster_id=cluster_id)
+    cluster = await asyncio.to_thread(client.clusters.get, cluster_id=cluster_id)
     cluster_name = cluster.cluster_name
 
     # Note: In Databricks SDK, delete() terminates the cluster (does not permanently delete)
     # permanent_delete() would permanently delete it
-    client.clusters.delete(cluster_id=cluster_id)
+    await asyncio.to_thread(client.clusters.delete, cluster_id=cluster_id)
 
     return {
         "cluster_id": cluster_id,
@@ -1370,11 +1711,20 @@ async def stop_cluster(client: WorkspaceClient, args: dict) -> dict:
     }
 
 
-async def create_cluster(client: WorkspaceClient, args: dict) -> dict:
-    """Create a new cluster with sensible defaults and Unity Catalog enabled."""
-    from datetime import timedelta
+@functools.cache
+def _data_security_modes() -> dict:
+    """Map data_security_mode argument values to SDK enums (built on first use; the SDK loads lazily)."""
     from databricks.sdk.service.compute import DataSecurityMode
 
+    return {
+        "SINGLE_USER": DataSecurityMode.SINGLE_USER,
+        "USER_ISOLATION": DataSecurityMode.USER_ISOLATION,
+        "NONE": DataSecurityMode.NONE,
+    }
+
+
+async def create_cluster(client: WorkspaceClient, args: dict) -> dict:
+    """Create a new cluster with sensible defaults and Unity Catalog enabled."""
     cluster_name = args["cluster_name"]
     num_workers = args.get("num_workers", 1)
     node_type_id = args.get("node_type_id", "m5.xlarge")
@@ -1385,19 +1735,17 @@ async def create_cluster(client: WorkspaceClient, args: dict) -> dict:
     timeout_minutes = args.get("timeout_minutes", 20)
 
     # Data security mode for Unity Catalog (default: SINGLE_USER)
-    data_security_mode_str = args.get("data_security_mode", "SINGLE_USER")
-    data_security_mode_map = {
-        "SINGLE_USER": DataSecurityMode.SINGLE_USER,
-        "USER_ISOLATION": DataSecurityMode.USER_ISOLATION,
-        "NONE": DataSecurityMode.NONE,
-    }
-    data_security_mode = data_security_mode_map.get(data_security_mode_str, DataSecurityMode.SINGLE_USER)
+    data_security_modes = _data_security_modes()
+    data_security_mode = data_security_modes.get(
+        args.get("data_security_mode", "SINGLE_USER"), data_security_modes["SINGLE_USER"]
+    )
+    single_user_mode = data_security_mode is data_security_modes["SINGLE_USER"]
 
     # For SINGLE_USER mode, get the user name (defaults to authenticated user)
     single_user_name = args.get("single_user_name")
-    if data_security_mode == DataSecurityMode.SINGLE_USER and not single_user_name:
+    if single_user_mode and not single_user_name:
         # Get the current user's email
-        current_user = client.current_user.me()
+        current_user = await asyncio.to_thread(client.current_user.me)
         single_user_name = current_user.user_name
 
     # Get user-provided custom tags (optional)
@@ -1418,14 +1766,15 @@ async def create_cluster(client: WorkspaceClient, args: dict) -> dict:
         create_kwargs["custom_tags"] = custom_tags
 
     # Add single_user_name for SINGLE_USER mode
-    if data_security_mode == DataSecurityMode.SINGLE_USER:
+    if single_user_mode:
         create_kwargs["single_user_name"] = single_user_name
 
     if policy_id:
         create_kwargs["policy_id"] = policy_id
 
     if wait:
-        cluster = client.clusters.create_and_wait(
+        cluster = await asyncio.to_thread(
+            client.clusters.create_and_wait,
             **create_kwargs,
             timeout=timedelta(minutes=timeout_minutes)
         )
@@ -1438,7 +1787,7 @@ async def create_cluster(client: WorkspaceClient, args: dict) -> dict:
         }
     else:
         # create() returns a Wait object, get the response
-        wait_obj = client.clusters.create(**create_kwargs)
+        wait_obj = await asyncio.to_thread(client.clusters.create, **create_kwargs)
         # The Wait object has a cluster_id attribute
         cluster_id = wait_obj.cluster_id
         return {
@@ -1451,15 +1800,16 @@ async def create_cluster(client: WorkspaceClient, args: dict) -> dict:
 
 async def list_cluster_policies(client: WorkspaceClient, args: dict) -> dict:
     """List available cluster policies."""
-    policies = client.cluster_policies.list()
+    policies = await asyncio.to_thread(lambda: list(client.cluster_policies.list()))
 
-    result = []
-    for policy in policies:
-        result.append({
+    result = [
+        {
             "policy_id": policy.policy_id,
             "name": policy.name,
             "description": policy.description,
-        })
+        }
+        for policy in policies
+    ]
 
     return {"policies": result, "count": len(result)}
 
@@ -1468,25 +1818,171 @@ async def list_cluster_policies(client: WorkspaceClient, args: dict) -> dict:
 # Interactive Execution Tool Implementations
 # ============================================================================
 
-async def create_context(client: WorkspaceClient, args: dict) -> dict:
-    """Create an execution context on a cluster."""
-    from databricks.sdk.service.compute import Language, ContextStatus
-    from datetime import timedelta
-
-    cluster_id = args["cluster_id"]
-    language_str = args.get("language", "python")
+@functools.cache
+def _languages() -> dict:
+    """Map language argument values to SDK enums (built on first use; the SDK loads lazily)."""
+    from databricks.sdk.service.compute import Language
 
-    # Map string to Language enum
-    language_map = {
+    return {
         "python": Language.PYTHON,
         "scala": Language.SCALA,
         "sql": Language.SQL,
         "r": Language.R,
     }
-    language = language_map.get(language_str.lower(), Language.PYTHON)
+
+
+def _language(language_str: str):
+    """SDK Language for a language argument, defaulting to Python."""
+    languages = _languages()
+    return languages.get(language_str.lower(), languages["python"])
+
+
+# Released execution contexts are kept warm for reuse instead of destroyed,
+# since creating one takes several seconds. Idle contexts are keyed by
+# (cluster_id, language), most recently released last.
+CONTEXT_IDLE_TTL = 20 * 60  # Seconds before an idle context is really destroyed
+MAX_IDLE_CONTEXTS = 4  # Per (cluster_id, language)
+_idle_contexts: dict[tuple[str, str], list[tuple[str, float]]] = {}
+_context_keys: dict[str, tuple[str, str]] = {}  # context_id -> pool key, for contexts in use
+_context_reaper: asyncio.Task | None = None
+CONTEXT_DRAIN_TIMEOUT = 5  # Seconds to spend destroying idle contexts on shutdown
+
+# A context runs one command at a time, so execute_cell calls against the same
+# context queue here rather than racing each other on the cluster
+_context_locks: dict[str, asyncio.Lock] = {}
+
+
+def _context_lock(context_id: str) -> asyncio.Lock:
+    """The lock serializing commands (and release) for a context."""
+    lock = _context_locks.get(context_id)
+    if lock is None:
+        lock = _context_locks[context_id] = asyncio.Lock()
+    return lock
+
+
+def _destroy_context_quietly(client: WorkspaceClient, cluster_id: str, context_id: str) -> None:
+    """Destroy a context, best effort (blocking; run in a worker thread)."""
+    try:
+        client.command_execution.destroy(cluster_id=cluster_id, context_id=context_id)
+    except Exception:
+        pass  # The context or its cluster is already gone
+
+
+async def _context_running(client: WorkspaceClient, cluster_id: str, context_id: str) -> bool:
+    """Whether a context still exists and is running on its cluster."""
+    from databricks.sdk.service.compute import ContextStatus
+
+    try:
+        status = await asyncio.to_thread(
+            client.command_execution.context_status,
+            cluster_id=cluster_id,
+            context_id=context_id
+        )
+    except Exception:
+        return False  # Context not found, or the cluster restarted
+    return status.status == ContextStatus.RUNNING
+
+
+async def _take_idle_context(client: WorkspaceClient, key: tuple[str, str]) -> str | None:
+    """Pop an idle context for key that is still running on the cluster, if any."""
+    entries = _idle_contexts.get(key)
+    while entries:
+        context_id, _ = entries.pop()
+        if not entries:
+            del _idle_contexts[key]
+        if await _context_running(client, key[0], context_id):
+            return context_id
+        entries = _idle_contexts.get(key)
+    return None
+
+
+async def _reap_idle_contexts(client: WorkspaceClient) -> None:
+    """Destroy idle contexts once they pass CONTEXT_IDLE_TTL; exits when the pool is empty."""
+    loop = asyncio.get_running_loop()
+    while _idle_contexts:
+        now = loop.time()
+        expired = []
+        next_expiry = now + CONTEXT_IDLE_TTL
+        for key, entries in list(_idle_contexts.items()):
+            keep = []
+            for context_id, released_at in entries:
+                if now - released_at >= CONTEXT_IDLE_TTL:
+                    expired.append((key[0], context_id))
+                    _context_locks.pop(context_id, None)
+                else:
+                    keep.append((context_id, released_at))
+                    next_expiry = min(next_expiry, released_at + CONTEXT_IDLE_TTL)
+            if keep:
+                _idle_contexts[key] = keep
+            else:
+                del _idle_contexts[key]
+        if expired:
+            await asyncio.gather(*(
+                asyncio.to_thread(_destroy_context_quietly, client, cluster_id, context_id)
+                for cluster_id, context_id in expired
+            ))
+        if _idle_contexts:
+            await asyncio.sleep(max(next_expiry - loop.time(), 0))
+
+
+async def _drain_idle_contexts() -> None:
+    """Destroy every idle pooled context, so none are left running after shutdown."""
+    if _context_reaper is not None:
+        _context_reaper.cancel()
+    idle = [(key[0], context_id) for key, entries in _idle_contexts.items() for context_id, _ in entries]
+    _idle_contexts.clear()
+    if idle and _client is not None:
+        try:
+            await asyncio.wait_for(asyncio.gather(*(
+                asyncio.to_thread(_destroy_context_quietly, _client, cluster_id, context_id)
+                for cluster_id, context_id in idle
+            )), CONTEXT_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass  # Don't hold up exit; the cluster reclaims them eventually
+
+
+def _release_context(client: WorkspaceClient, key: tuple[str, str], context_id: str) -> bool:
+    """Park a context in the idle pool; False if that key's pool is already full."""
+    global _context_reaper
+
+    entries = _idle_contexts.setdefault(key, [])
+    if len(entries) >= MAX_IDLE_CONTEXTS:
+        return False
+    entries.append((context_id, asyncio.get_running_loop().time()))
+    if _context_reaper is None or _context_reaper.done():
+        _context_reaper = asyncio.create_task(_reap_idle_contexts(client))
+    return True
+
+
+async def create_context(client: WorkspaceClient, args: dict) -> dict:
+    """Create an execution context on a cluster."""
+    from databricks.sdk.service.compute import ContextStatus
+
+    cluster_id = args["cluster_id"]
+    language_str = args.get("language", "python")
+
+    language = _language(language_str)
+    key = (cluster_id, language.value)
+
+    context_id = await _take_idle_context(client, key)
+    if context_id is not None:
+        _context_keys[context_id] = key
+        return {
+            "success": True,
+            "context_id": context_id,
+            "cluster_id": cluster_id,
+            "language": language_str,
+            "status": ContextStatus.RUNNING.value,
+            "reused": True,
+            "message": (
+                "Reusing an idle execution context; variables from its earlier use may still be defined. "
+                f"Use databricks_execute_cell with context_id={context_id}"
+            )
+        }
 
     # Create context and wait for it to be ready
-    context = client.command_execution.create_and_wait(
+    context = await asyncio.to_thread(
+        client.command_execution.create_and_wait,
         cluster_id=cluster_id,
         language=language,
         timeout=timedelta(minutes=5)
@@ -1501,6 +1997,7 @@ async def create_context(client: WorkspaceClient, args: dict) -> dict:
             "error": f"Context creation failed with status: {context.status}"
         }
 
+    _context_keys[context.id] = key
     return {
         "success": True,
         "context_id": context.id,
@@ -1511,11 +2008,78 @@ async def create_context(client: WorkspaceClient, args: dict) -> dict:
     }
 
 
+# Command status polling in execute_cell; most cells finish within seconds
+COMMAND_POLL_INTERVAL = 1.0
+MAX_COMMAND_POLL_INTERVAL = 5.0
+
+
+def _cancel_command(client: WorkspaceClient, cluster_id: str, context_id: str, command_id: str) -> None:
+    """Cancel a command on the cluster, best effort (blocking; run in a worker thread)."""
+    try:
+        client.command_execution.cancel(cluster_id=cluster_id, context_id=context_id, command_id=command_id)
+    except Exception:
+        pass  # Already finished, or the context is gone
+
+
+async def _run_command(
+    client: WorkspaceClient,
+    cluster_id: str,
+    context_id: str,
+    code: str,
+    language,
+    timeout_seconds: float,
+):
+    """Submit a command and poll until it ends.
+
+    Returns (command_id, status response), with None in place of the response if
+    the command timed out. Commands that time out or whose caller is cancelled
+    are cancelled on the cluster, so they don't keep the context busy.
+    """
+    from databricks.sdk.service.compute import CommandStatus
+
+    done_states = (CommandStatus.FINISHED, CommandStatus.ERROR, CommandStatus.CANCELLED)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+
+    submitted = await asyncio.to_thread(
+        client.command_execution.execute,
+        cluster_id=cluster_id,
+        context_id=context_id,
+        command=code,
+        language=language
+    )
+    command_id = submitted.command_id
+
+    delay = COMMAND_POLL_INTERVAL
+    try:
+        while True:
+            response = await asyncio.to_thread(
+                client.command_execution.command_status,
+                cluster_id=cluster_id,
+                context_id=context_id,
+                command_id=command_id
+            )
+            if response.status in done_states:
+                return command_id, response
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = _next_poll_delay(delay, MAX_COMMAND_POLL_INTERVAL)
+    except asyncio.CancelledError:
+        # Don't wait on the cancel; the caller is already going away
+        loop.run_in_executor(None, _cancel_command, client, cluster_id, context_id, command_id)
+        raise
+
+    await asyncio.to_thread(_cancel_command, client, cluster_id, context_id, command_id)
+    return command_id, None
+
+
 async def execute_cell(client: WorkspaceClient, args: dict) -> dict:
     """Execute code in an execution context with output size protection."""
-    from databricks.sdk.service.compute import Language, CommandStatus, ResultType
-    from datetime import timedelta
-    import json
+    from databricks.sdk.service.compute import CommandStatus, ResultType
 
     cluster_id = args["cluster_id"]
     context_id = args["context_id"]
@@ -1523,27 +2087,33 @@ async def execute_cell(client: WorkspaceClient, args: dict) -> dict:
     language_str = args.get("language", "python")
     timeout_minutes = args.get("timeout_minutes", 30)
 
-    # Map string to Language enum
-    language_map = {
-        "python": Language.PYTHON,
-        "scala": Language.SCALA,
-        "sql": Language.SQL,
-        "r": Language.R,
-    }
-    language = language_map.get(language_str.lower(), Language.PYTHON)
+    language = _language(language_str)
 
-    # Execute command and wait for result
-    response = client.command_execution.execute_and_wait(
-        cluster_id=cluster_id,
-        context_id=context_id,
-        command=code,
-        language=language,
-        timeout=timedelta(minutes=timeout_minutes)
-    )
+    # Execute command and wait for result, polling from the event loop rather
+    # than holding a worker thread for the whole run
+    lock = _context_lock(context_id)
+    try:
+        async with lock:
+            command_id, response = await _run_command(
+                client, cluster_id, context_id, code, language, timeout_minutes * 60
+            )
+    except Exception:
+        # Forget unknown or expired contexts, or their locks would pile up
+        if not await _context_running(client, cluster_id, context_id):
+            _context_locks.pop(context_id, None)
+            _context_keys.pop(context_id, None)
+        raise
+    if response is None:
+        return {
+            "success": False,
+            "status": "TIMEOUT",
+            "command_id": command_id,
+            "message": f"Command did not finish within {timeout_minutes} minutes and was cancelled"
+        }
 
     # Determine success/failure
     is_error = (
-        response.status == CommandStatus.ERROR or
+        response.status in (CommandStatus.ERROR, CommandStatus.CANCELLED) or
         (response.results and response.results.result_type == ResultType.ERROR)
     )
 
@@ -1562,56 +2132,102 @@ async def execute_cell(client: WorkspaceClient, args: dict) -> dict:
         # Handle data - could be string, dict, list, etc.
         data = results.data
         if data is not None:
-            # Convert to string for size checking if needed
+            # Size check, in characters; an estimate over the cap rules the data
+            # out without serializing all of it, and anything under it is
+            # measured exactly
             if isinstance(data, str):
                 data_str = data
+            elif _approx_json_size(data, MAX_TEXT_SIZE) > MAX_TEXT_SIZE:
+                data_str = None
             else:
-                try:
-                    data_str = json.dumps(data)
-                except (TypeError, ValueError):
-                    data_str = str(data)
+                data_str = _dumps(data)
 
-            if len(data_str) > MAX_TEXT_SIZE:
+            if data_str is None or len(data_str) > MAX_TEXT_SIZE:
                 # For table data (list of rows), try to truncate by rows
-                if isinstance(data, list) and len(data) > 0:
-                    # Estimate rows to keep
-                    avg_row_size = len(data_str) / len(data)
-                    rows_to_keep = max(1, int(MAX_TEXT_SIZE / avg_row_size))
-                    result["data"] = data[:rows_to_keep]
-                    result["data_truncated"] = True
-                    result["data_total_rows"] = len(data)
-                    result["data_shown_rows"] = rows_to_keep
-                    result["truncation_note"] = f"Showing {rows_to_keep} of {len(data)} rows. Add LIMIT to your query for smaller results."
+                rows_to_keep = _rows_within_size(data, MAX_TEXT_SIZE) if isinstance(data, list) else 0
+                if rows_to_keep:
+                    if rows_to_keep < len(data):
+                        result["data"] = data[:rows_to_keep]
+                        result["data_truncated"] = True
+                        result["data_total_rows"] = len(data)
+                        result["data_shown_rows"] = rows_to_keep
+                        result["truncation_note"] = f"Showing {rows_to_keep} of {len(data)} rows. Add LIMIT to your query for smaller results."
+                    else:
+                        result["data"] = data  # Every row fits after all
                 else:
-                    # For string data, truncate by characters
-                    truncated_data, meta = truncate_text(data_str, MAX_TEXT_SIZE, "data")
-                    result["data"] = truncated_data
-                    result.update(meta)
+                    # For string data, or a first row too big on its own, truncate by characters
+                    if data_str is None:
+                        data_str = _dumps(data)
+                    if len(data_str) > MAX_TEXT_SIZE:
+                        truncated_data, meta = truncate_text(data_str, MAX_TEXT_SIZE, "data")
+                        result["data"] = truncated_data
+                        result.update(meta)
+                    else:
+                        result["data"] = data  # Over the estimate, but the exact size fits
             else:
                 result["data"] = data
 
         # Include error info if present
-        if results.cause:
-            result["error_cause"] = results.cause
-        if results.summary:
-            result["error_summary"] = results.summary
-
-        # Include schema for table results (useful for understanding structure)
-        if results.schema:
+        if args.get("include_error_detail", True):
+            if results.cause:
+                result["error_cause"] = results.cause
+            if results.summary:
+                result["error_summary"] = results.summary
+
+        # Schema for table results, on request (wide tables make it large)
+        if args.get("include_schema", False) and results.schema:
             result["schema"] = results.schema
 
     return result
 
 
 async def destroy_context(client: WorkspaceClient, args: dict) -> dict:
-    """Destroy an execution context."""
+    """Release an execution context to the idle pool, or destroy it."""
     cluster_id = args["cluster_id"]
     context_id = args["context_id"]
 
-    client.command_execution.destroy(
-        cluster_id=cluster_id,
-        context_id=context_id
-    )
+    # A context with a command in flight is neither pooled as idle nor
+    # destroyed under it
+    lock = _context_lock(context_id)
+    if lock.locked():
+        return {
+            "success": False,
+            "context_id": context_id,
+            "cluster_id": cluster_id,
+            "status": "busy",
+            "error": (
+                "A command is still running in this context. Wait for databricks_execute_cell "
+                "to return, or cancel it, then destroy the context."
+            )
+        }
+
+    async with lock:
+        key = _context_keys.pop(context_id, None)
+        if (
+            not args.get("force", False)
+            and key is not None
+            and key[0] == cluster_id
+            and _release_context(client, key, context_id)
+        ):
+            return {
+                "context_id": context_id,
+                "cluster_id": cluster_id,
+                "status": "released",
+                "message": (
+                    "Execution context released for reuse; it is destroyed after "
+                    f"{CONTEXT_IDLE_TTL // 60} idle minutes. Pass force=true to destroy it now."
+                )
+            }
+
+        try:
+            await asyncio.to_thread(
+                client.command_execution.destroy,
+                cluster_id=cluster_id,
+                context_id=context_id
+            )
+        finally:
+            if _context_locks.get(context_id) is lock:
+                del _context_locks[context_id]
 
     return {
         "context_id": context_id,
@@ -1621,19 +2237,117 @@ async def destroy_context(client: WorkspaceClient, args: dict) -> dict:
     }
 
 
+# ============================================================================
+# Tool Dispatch
+# ============================================================================
+
+# Maps tool names to their handlers; looked up once per call_tool request.
+# Read-only: every handler must be registered here at import time.
+_HANDLERS = MappingProxyType({
+    # Notebook tools
+    "databricks_run_notebook": run_notebook,
+    "databricks_get_run_output": get_run_output,
+    "databricks_wait_for_run": wait_for_run,
+    "databricks_read_notebook": read_notebook,
+    "databricks_write_notebook": write_notebook,
+    "databricks_list_notebooks": list_notebooks,
+    "databricks_update_notebook_cell": update_notebook_cell,
+
+    # Job tools
+    "databricks_create_job": create_job,
+    "databricks_run_job": run_job,
+    "databricks_get_job_run_status": get_job_run_status,
+    "databricks_get_run_logs": get_run_logs,
+    "databricks_list_jobs": list_jobs,
+    "databricks_cancel_run": cancel_run,
+
+    # Cluster tools
+    "databricks_list_clusters": list_clusters,
+    "databricks_get_cluster_status": get_cluster_status,
+    "databricks_start_cluster": start_cluster,
+    "databricks_stop_cluster": stop_cluster,
+    "databricks_create_cluster": create_cluster,
+    "databricks_list_cluster_policies": list_cluster_policies,
+
+    # Interactive execution tools
+    "databricks_create_context": create_context,
+    "databricks_execute_cell": execute_cell,
+    "databricks_destroy_context": destroy_context,
+})
+
+# Tools without side effects; identical concurrent calls share one execution
+_SHAREABLE_TOOLS = frozenset({
+    "databricks_get_run_output",
+    "databricks_wait_for_run",
+    "databricks_read_notebook",
+    "databricks_list_notebooks",
+    "databricks_get_job_run_status",
+    "databricks_get_run_logs",
+    "databricks_list_jobs",
+    "databricks_list_clusters",
+    "databricks_get_cluster_status",
+    "databricks_list_cluster_policies",
+})
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
 
+_shutdown_task: asyncio.Task | None = None
+
+
+async def _terminate(loop: asyncio.AbstractEventLoop) -> None:
+    """Clean up, then exit on SIGTERM as if no handler were installed."""
+    try:
+        await _drain_idle_contexts()
+    finally:
+        # Cancelling the server can't interrupt its blocking stdin read, so
+        # let the default action end the process instead
+        loop.remove_signal_handler(signal.SIGTERM)
+        signal.raise_signal(signal.SIGTERM)
+
+
+def _on_sigterm(loop: asyncio.AbstractEventLoop) -> None:
+    """SIGTERM handler: destroy idle pooled contexts before exiting."""
+    global _shutdown_task
+
+    if _shutdown_task is None:
+        _shutdown_task = loop.create_task(_terminate(loop))
+
+
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    loop = asyncio.get_running_loop()
+
+    # Blocking SDK calls run in worker threads (asyncio.to_thread); size the pool
+    # so parallel tool calls don't queue behind each other
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=SDK_WORKER_THREADS))
+
+    # Start tasks eagerly so coroutines that finish without suspending skip a
+    # trip through the scheduler (Python 3.12+; older versions keep the default)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, _on_sigterm, loop)
+    except NotImplementedError:  # No loop signal handlers on Windows
+        pass
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        # The client closed stdin
+        await _drain_idle_contexts()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
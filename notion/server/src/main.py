@@ -7,11 +7,20 @@ that works on any Notion plan (not just Enterprise).
 """
 
 import asyncio
-import json
+import functools
+import itertools
 import os
+import time
 from typing import Any
 
 import httpx
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; fall back to the default loop
+    uvloop = None
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -23,35 +32,92 @@ NOTION_API_VERSION_NEW = "2025-09-03"  # Required for multi-data-source database
 NOTION_BASE_URL = "https://api.notion.com/v1"
 MAX_TEXT_SIZE = 100_000
 MAX_LIST_ITEMS = 100
+NOTION_CONNECTION_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0)
+MAX_CONCURRENT_BLOCK_FETCHES = 8  # Keeps recursive page fetches under Notion's rate limit
+
+DATABASE_CACHE_TTL = 300  # Seconds; database schemas rarely change
+DATABASE_CACHE_SIZE = 256
+
+# Shared by all get_page_content calls, so concurrent tool calls don't multiply the limit
+_block_fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_BLOCK_FETCHES)
+
+
+# API key, read once at startup (the server is launched with its env)
+NOTION_API_KEY = os.environ.get("NOTION_API_KEY")
+
+# Responses are compact JSON unless NOTION_MCP_PRETTY=1 asks for indentation
+NOTION_MCP_PRETTY = os.environ.get("NOTION_MCP_PRETTY") == "1"
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if NOTION_MCP_PRETTY else 0)
 
 
 def get_api_key() -> str:
     """Get Notion API key from environment."""
-    key = os.environ.get("NOTION_API_KEY")
-    if not key:
+    if not NOTION_API_KEY:
         raise ValueError("NOTION_API_KEY environment variable is required")
-    return key
+    return NOTION_API_KEY
+
+
+@functools.cache
+def _headers(use_new_api: bool) -> dict[str, str]:
+    """Request headers for one API version (built on first use)."""
+    return {
+        "Authorization": f"Bearer {get_api_key()}",
+        "Notion-Version": NOTION_API_VERSION_NEW if use_new_api else NOTION_API_VERSION,
+        "Content-Type": "application/json",
+    }
+
+
+# Shared clients, one per API version, created on first use so their
+# connection pools (and TLS sessions) are reused across tool calls
+_clients: dict[bool, httpx.AsyncClient] = {}
 
 
 def get_client(use_new_api: bool = False) -> httpx.AsyncClient:
-    """Create configured httpx client for Notion API."""
-    api_version = NOTION_API_VERSION_NEW if use_new_api else NOTION_API_VERSION
-    return httpx.AsyncClient(
-        base_url=NOTION_BASE_URL,
-        headers={
-            "Authorization": f"Bearer {get_api_key()}",
-            "Notion-Version": api_version,
-            "Content-Type": "application/json",
-        },
-        timeout=60.0,
-    )
-
-
-def truncate_text(text: str, max_size: int = MAX_TEXT_SIZE) -> str:
-    """Truncate text to prevent overwhelming responses."""
-    if not text or len(text) <= max_size:
-        return text
-    return text[:max_size] + f"\n\n[... truncated, showing {max_size:,} of {len(text):,} chars]"
+    """Get the configured httpx client for Notion API."""
+    client = _clients.get(use_new_api)
+    if client is None:
+        client = _clients[use_new_api] = httpx.AsyncClient(
+            base_url=NOTION_BASE_URL,
+            headers=_headers(use_new_api),
+            timeout=60.0,
+            # Concurrent requests (e.g. nested block fetches) share one
+            # multiplexed connection instead of queueing for pool slots
+            http2=True,
+            limits=NOTION_CONNECTION_LIMITS,
+        )
+    return client
+
+
+async def close_clients() -> None:
+    """Close the shared clients and their connections."""
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients))
+
+
+def _decode(response: httpx.Response) -> Any:
+    """Parse a Notion JSON response body."""
+    return orjson.loads(response.content)
+
+
+def _discard(task: asyncio.Future) -> None:
+    """Cancel a task whose result is no longer needed, without leaving its error unretrieved."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _clean_id(notion_id: str) -> str:
+    """Strip dashes from a UUID-style Notion ID, as used in API paths."""
+    return notion_id.replace("-", "")
+
+
+def truncate_text(encoded: bytes, max_size: int = MAX_TEXT_SIZE) -> str:
+    """Decode an encoded response, truncated to prevent overwhelming responses."""
+    if len(encoded) <= max_size:
+        return encoded.decode()
+    # Only the kept prefix is decoded; drop a character split at the cut
+    text = encoded[:max_size].decode(errors="ignore")
+    return text + f"\n\n[... truncated, showing {max_size:,} of {len(encoded):,} bytes]"
 
 
 def extract_plain_text(rich_text: list[dict]) -> str:
@@ -59,56 +125,99 @@ def extract_plain_text(rich_text: list[dict]) -> str:
     return "".join(item.get("plain_text", "") for item in rich_text)
 
 
-def format_property_value(prop: dict) -> Any:
-    """Format a Notion property value for display."""
-    prop_type = prop.get("type")
+def _property_direct(value: Any) -> Any:
+    return value
 
-    # Simple direct value types
-    if prop_type in ("number", "checkbox", "url", "email", "phone_number", "created_time", "last_edited_time"):
-        return prop.get(prop_type)
 
-    # Rich text types
-    if prop_type in ("title", "rich_text"):
-        return extract_plain_text(prop.get(prop_type, []))
+def _property_rich_text(value: list | None) -> str:
+    return extract_plain_text(value or [])
 
-    # Single select types (select, status)
-    if prop_type in ("select", "status"):
-        value = prop.get(prop_type)
-        return value.get("name") if value else None
 
-    # Multi-value types
-    if prop_type == "multi_select":
-        return [item.get("name") for item in prop.get("multi_select", [])]
-    if prop_type == "people":
-        return [p.get("name", p.get("id")) for p in prop.get("people", [])]
-    if prop_type == "relation":
-        return [r.get("id") for r in prop.get("relation", [])]
+def _property_select(value: dict | None) -> str | None:
+    return value.get("name") if value else None
 
-    # Date with range support
-    if prop_type == "date":
-        date = prop.get("date")
-        if not date:
-            return None
-        start = date.get("start", "")
-        end = date.get("end")
-        return f"{start} - {end}" if end else start
-
-    # Computed types (formula, rollup)
-    if prop_type in ("formula", "rollup"):
-        computed = prop.get(prop_type, {})
-        return computed.get(computed.get("type"))
 
+def _property_multi_select(value: list | None) -> list:
+    return [item.get("name") for item in value or []]
+
+
+def _property_people(value: list | None) -> list:
+    return [p.get("name", p.get("id")) for p in value or []]
+
+
+def _property_relation(value: list | None) -> list:
+    return [r.get("id") for r in value or []]
+
+
+def _property_date(value: dict | None) -> str | None:
+    if not value:
+        return None
+    start = value.get("start", "")
+    end = value.get("end")
+    return f"{start} - {end}" if end else start
+
+
+def _property_computed(value: dict | None) -> Any:
+    if not value:
+        return None
+    return value.get(value.get("type"))
+
+
+def _property_user(value: dict | None) -> Any:
+    if not value:
+        return None
+    return value.get("name", value.get("id"))
+
+
+# Property type -> formatter of the property's value (prop[prop_type]);
+# types not listed are returned as-is
+_PROPERTY_FORMATTERS = {
+    # Simple direct value types
+    "number": _property_direct,
+    "checkbox": _property_direct,
+    "url": _property_direct,
+    "email": _property_direct,
+    "phone_number": _property_direct,
+    "created_time": _property_direct,
+    "last_edited_time": _property_direct,
+    # Rich text types
+    "title": _property_rich_text,
+    "rich_text": _property_rich_text,
+    # Single select types
+    "select": _property_select,
+    "status": _property_select,
+    # Multi-value types
+    "multi_select": _property_multi_select,
+    "people": _property_people,
+    "relation": _property_relation,
+    # Date with range support
+    "date": _property_date,
+    # Computed types
+    "formula": _property_computed,
+    "rollup": _property_computed,
     # User reference types
-    if prop_type in ("created_by", "last_edited_by"):
-        user = prop.get(prop_type, {})
-        return user.get("name", user.get("id"))
+    "created_by": _property_user,
+    "last_edited_by": _property_user,
+}
 
-    return prop
+
+def format_property_value(prop: dict) -> Any:
+    """Format a Notion property value for display."""
+    prop_type = prop.get("type")
+    formatter = _PROPERTY_FORMATTERS.get(prop_type)
+    return formatter(prop.get(prop_type)) if formatter else prop
 
 
 def format_page_properties(properties: dict) -> dict:
     """Format all properties of a page for display."""
-    return {name: format_property_value(prop) for name, prop in properties.items()}
+    # format_property_value inlined: this runs for every property of every result
+    get_formatter = _PROPERTY_FORMATTERS.get
+    formatted = {}
+    for name, prop in properties.items():
+        prop_type = prop.get("type")
+        formatter = get_formatter(prop_type)
+        formatted[name] = formatter(prop.get(prop_type)) if formatter else prop
+    return formatted
 
 
 def format_user(user: dict) -> dict:
@@ -122,6 +231,98 @@ def format_user(user: dict) -> dict:
     }
 
 
+def _block_text(formatted: dict, block_data: dict) -> None:
+    formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
+
+
+def _block_callout(formatted: dict, block_data: dict) -> None:
+    formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
+    icon = block_data.get("icon", {})
+    if icon.get("type") == "emoji":
+        formatted["icon"] = icon.get("emoji")
+
+
+def _block_to_do(formatted: dict, block_data: dict) -> None:
+    formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
+    formatted["checked"] = block_data.get("checked", False)
+
+
+def _block_code(formatted: dict, block_data: dict) -> None:
+    formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
+    formatted["language"] = block_data.get("language", "plain text")
+
+
+def _block_link(formatted: dict, block_data: dict) -> None:
+    formatted["url"] = block_data.get("url")
+
+
+def _block_file(formatted: dict, block_data: dict) -> None:
+    file_data = block_data.get(block_data.get("type", ""), {})
+    formatted["url"] = file_data.get("url") or block_data.get("external", {}).get("url")
+    caption = block_data.get("caption", [])
+    if caption:
+        formatted["caption"] = extract_plain_text(caption)
+
+
+def _block_table(formatted: dict, block_data: dict) -> None:
+    formatted["table_width"] = block_data.get("table_width")
+    formatted["has_column_header"] = block_data.get("has_column_header")
+    formatted["has_row_header"] = block_data.get("has_row_header")
+
+
+def _block_table_row(formatted: dict, block_data: dict) -> None:
+    cells = block_data.get("cells", [])
+    formatted["cells"] = [extract_plain_text(cell) for cell in cells]
+
+
+def _block_child(formatted: dict, block_data: dict) -> None:
+    formatted["title"] = block_data.get("title")
+
+
+def _block_synced(formatted: dict, block_data: dict) -> None:
+    synced_from = block_data.get("synced_from")
+    if synced_from:
+        formatted["synced_from"] = synced_from.get("block_id")
+
+
+def _block_equation(formatted: dict, block_data: dict) -> None:
+    formatted["expression"] = block_data.get("expression")
+
+
+# Block type -> formatter adding its content fields; types not listed (divider,
+# table_of_contents, breadcrumb, ...) need nothing beyond id and type
+_BLOCK_FORMATTERS = {
+    # Text-based blocks (paragraph, headings, lists, quotes, toggles)
+    "paragraph": _block_text,
+    "heading_1": _block_text,
+    "heading_2": _block_text,
+    "heading_3": _block_text,
+    "bulleted_list_item": _block_text,
+    "numbered_list_item": _block_text,
+    "quote": _block_text,
+    "toggle": _block_text,
+    "callout": _block_callout,
+    "to_do": _block_to_do,
+    "code": _block_code,
+    # Bookmark/embed/link blocks
+    "bookmark": _block_link,
+    "embed": _block_link,
+    "link_preview": _block_link,
+    # Image/file/video/pdf blocks
+    "image": _block_file,
+    "file": _block_file,
+    "video": _block_file,
+    "pdf": _block_file,
+    "table": _block_table,
+    "table_row": _block_table_row,
+    # Child page/database references
+    "child_page": _block_child,
+    "child_database": _block_child,
+    "synced_block": _block_synced,
+    "equation": _block_equation,
+}
+
+
 def format_block(block: dict) -> dict:
     """Format a Notion block for readable display."""
     block_type = block.get("type", "unknown")
@@ -131,75 +332,9 @@ def format_block(block: dict) -> dict:
     }
 
     # Extract content based on block type
-    block_data = block.get(block_type, {})
-
-    # Text-based blocks (paragraph, headings, lists, quotes, callouts)
-    if block_type in (
-        "paragraph", "heading_1", "heading_2", "heading_3",
-        "bulleted_list_item", "numbered_list_item", "quote", "callout"
-    ):
-        formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
-        if block_type == "callout":
-            icon = block_data.get("icon", {})
-            if icon.get("type") == "emoji":
-                formatted["icon"] = icon.get("emoji")
-
-    # To-do items
-    elif block_type == "to_do":
-        formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
-        formatted["checked"] = block_data.get("checked", False)
-
-    # Toggle blocks
-    elif block_type == "toggle":
-        formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
-
-    # Code blocks
-    elif block_type == "code":
-        formatted["content"] = extract_plain_text(block_data.get("rich_text", []))
-        formatted["language"] = block_data.get("language", "plain text")
-
-    # Bookmark/embed/link blocks
-    elif block_type in ("bookmark", "embed", "link_preview"):
-        formatted["url"] = block_data.get("url")
-
-    # Image/file/video/pdf blocks
-    elif block_type in ("image", "file", "video", "pdf"):
-        file_data = block_data.get(block_data.get("type", ""), {})
-        formatted["url"] = file_data.get("url") or block_data.get("external", {}).get("url")
-        caption = block_data.get("caption", [])
-        if caption:
-            formatted["caption"] = extract_plain_text(caption)
-
-    # Table blocks
-    elif block_type == "table":
-        formatted["table_width"] = block_data.get("table_width")
-        formatted["has_column_header"] = block_data.get("has_column_header")
-        formatted["has_row_header"] = block_data.get("has_row_header")
-
-    # Table row blocks
-    elif block_type == "table_row":
-        cells = block_data.get("cells", [])
-        formatted["cells"] = [extract_plain_text(cell) for cell in cells]
-
-    # Divider, table_of_contents, breadcrumb - no content needed
-    elif block_type in ("divider", "table_of_contents", "breadcrumb"):
-        pass  # type is enough
-
-    # Child page/database references
-    elif block_type == "child_page":
-        formatted["title"] = block_data.get("title")
-    elif block_type == "child_database":
-        formatted["title"] = block_data.get("title")
-
-    # Synced block
-    elif block_type == "synced_block":
-        synced_from = block_data.get("synced_from")
-        if synced_from:
-            formatted["synced_from"] = synced_from.get("block_id")
-
-    # Equation block
-    elif block_type == "equation":
-        formatted["expression"] = block_data.get("expression")
+    formatter = _BLOCK_FORMATTERS.get(block_type)
+    if formatter:
+        formatter(formatted, block.get(block_type, {}))
 
     # Add has_children flag if true (for nested content)
     if block.get("has_children"):
@@ -213,7 +348,7 @@ server = Server("notion")
 
 
 # Define available tools
-TOOLS = [
+TOOLS: tuple[Tool, ...] = (
     # Data Source Query Tool (the key feature!)
     Tool(
         name="notion_query_data_source",
@@ -278,6 +413,11 @@ Filter operators by property type:
                 "database_id": {
                     "type": "string",
                     "description": "The ID of the database (UUID format)"
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Bypass the 5-minute schema cache, e.g. after changing the database's properties (default: false)",
+                    "default": False
                 }
             },
             "required": ["database_id"]
@@ -500,50 +640,57 @@ Filter operators by property type:
             "required": ["user_id"]
         }
     ),
-]
+)
+
+# The tool set never changes, so list_tools hands back the same list each time
+_TOOLS_LIST = list(TOOLS)
 
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """Return available tools."""
-    return TOOLS
+    return _TOOLS_LIST
+
+
+# Tools that need the new API version (database/data source operations)
+_NEW_API_TOOLS = frozenset({"notion_get_database", "notion_query_data_source", "notion_create_page"})
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
-        # Use new API version for database/data source operations
-        use_new_api = name in ("notion_get_database", "notion_query_data_source", "notion_create_page")
-
-        async with get_client(use_new_api=use_new_api) as client:
-            if name == "notion_query_data_source":
-                result = await query_data_source(client, arguments)
-            elif name == "notion_get_database":
-                result = await get_database(client, arguments)
-            elif name == "notion_search":
-                result = await search(client, arguments)
-            elif name == "notion_get_page":
-                result = await get_page(client, arguments)
-            elif name == "notion_get_page_content":
-                result = await get_page_content(client, arguments)
-            elif name == "notion_create_page":
-                result = await create_page(client, arguments)
-            elif name == "notion_update_page":
-                result = await update_page(client, arguments)
-            elif name == "notion_append_blocks":
-                result = await append_blocks(client, arguments)
-            elif name == "notion_update_block":
-                result = await update_block(client, arguments)
-            elif name == "notion_list_users":
-                result = await list_users(client, arguments)
-            elif name == "notion_get_user":
-                result = await get_user(client, arguments)
-            else:
-                result = {"error": f"Unknown tool: {name}"}
-
-        text = json.dumps(result, indent=2, default=str)
-        return [TextContent(type="text", text=truncate_text(text))]
+        use_new_api = name in _NEW_API_TOOLS
+
+        client = get_client(use_new_api=use_new_api)
+
+        if name == "notion_query_data_source":
+            result = await query_data_source(client, arguments)
+        elif name == "notion_get_database":
+            result = await get_database(client, arguments)
+        elif name == "notion_search":
+            result = await search(client, arguments)
+        elif name == "notion_get_page":
+            result = await get_page(client, arguments)
+        elif name == "notion_get_page_content":
+            result = await get_page_content(client, arguments)
+        elif name == "notion_create_page":
+            result = await create_page(client, arguments)
+        elif name == "notion_update_page":
+            result = await update_page(client, arguments)
+        elif name == "notion_append_blocks":
+            result = await append_blocks(client, arguments)
+        elif name == "notion_update_block":
+            result = await update_block(client, arguments)
+        elif name == "notion_list_users":
+            result = await list_users(client, arguments)
+        elif name == "notion_get_user":
+            result = await get_user(client, arguments)
+        else:
+            result = {"error": f"Unknown tool: {name}"}
+
+        encoded = orjson.dumps(result, default=str, option=_JSON_OPTIONS)
+        return [TextContent(type="text", text=truncate_text(encoded))]
 
     except httpx.HTTPStatusError as e:
         error_body = e.response.text
@@ -559,7 +706,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
 async def query_data_source(client: httpx.AsyncClient, args: dict) -> dict:
     """Query a Notion data source with filters and sorts (new API)."""
-    data_source_id = args["data_source_id"].replace("-", "")
+    data_source_id = _clean_id(args["data_source_id"])
 
     body = {}
     if "filter" in args:
@@ -573,11 +720,11 @@ async def query_data_source(client: httpx.AsyncClient, args: dict) -> dict:
 
     response = await client.post(f"/data_sources/{data_source_id}/query", json=body)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     # Format results for readability
     results = []
-    for page in data.get("results", [])[:MAX_LIST_ITEMS]:
+    for page in itertools.islice(data.get("results", []), MAX_LIST_ITEMS):
         formatted = {
             "id": page["id"],
             "url": page.get("url"),
@@ -595,13 +742,24 @@ async def query_data_source(client: httpx.AsyncClient, args: dict) -> dict:
     }
 
 
+_SELECT_PROPERTY_TYPES = frozenset({"select", "multi_select", "status"})
+
+# Formatted get_database results: database_id -> (expires_at, result), oldest first
+_database_cache: dict[str, tuple[float, dict]] = {}
+
+
 async def get_database(client: httpx.AsyncClient, args: dict) -> dict:
-    """Get database metadata and schema."""
-    database_id = args["database_id"].replace("-", "")
+    """Get database metadata and schema, cached for DATABASE_CACHE_TTL seconds."""
+    database_id = _clean_id(args["database_id"])
+
+    cached = _database_cache.pop(database_id, None)
+    if cached and not args.get("refresh", False) and cached[0] > time.monotonic():
+        _database_cache[database_id] = cached  # Re-insert as most recently used
+        return cached[1]
 
     response = await client.get(f"/databases/{database_id}")
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     # Extract data sources (for multi-source databases)
     data_sources = [
@@ -616,7 +774,7 @@ async def get_database(client: httpx.AsyncClient, args: dict) -> dict:
         prop_info = {"type": prop_type, "id": prop.get("id")}
 
         # Add options for select-like types
-        if prop_type in ("select", "multi_select", "status"):
+        if prop_type in _SELECT_PROPERTY_TYPES:
             type_data = prop.get(prop_type, {})
             prop_info["options"] = [opt["name"] for opt in type_data.get("options", [])]
             if prop_type == "status":
@@ -641,6 +799,9 @@ async def get_database(client: httpx.AsyncClient, args: dict) -> dict:
         result["data_sources"] = data_sources
         result["note"] = "This database has multiple data sources. Use notion_query_data_source with a data_source_id to query."
 
+    if len(_database_cache) >= DATABASE_CACHE_SIZE:
+        del _database_cache[next(iter(_database_cache))]
+    _database_cache[database_id] = (time.monotonic() + DATABASE_CACHE_TTL, result)
     return result
 
 
@@ -659,10 +820,10 @@ async def search(client: httpx.AsyncClient, args: dict) -> dict:
 
     response = await client.post("/search", json=body)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     results = []
-    for item in data.get("results", [])[:MAX_LIST_ITEMS]:
+    for item in itertools.islice(data.get("results", []), MAX_LIST_ITEMS):
         obj_type = item.get("object")
         formatted = {
             "id": item["id"],
@@ -689,11 +850,11 @@ async def search(client: httpx.AsyncClient, args: dict) -> dict:
 
 async def get_page(client: httpx.AsyncClient, args: dict) -> dict:
     """Get a page's properties."""
-    page_id = args["page_id"].replace("-", "")
+    page_id = _clean_id(args["page_id"])
 
     response = await client.get(f"/pages/{page_id}")
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     return {
         "id": data["id"],
@@ -710,38 +871,93 @@ async def get_page(client: httpx.AsyncClient, args: dict) -> dict:
 
 async def get_page_content(client: httpx.AsyncClient, args: dict) -> dict:
     """Get content blocks of a page."""
-    page_id = args["page_id"].replace("-", "")
+    page_id = _clean_id(args["page_id"])
     fetch_all = args.get("fetch_all", True)
     page_size = min(args.get("page_size", 100), 100)
 
+    # Encoded size of the blocks fetched so far. Past MAX_TEXT_SIZE the response
+    # would be truncated anyway, so no further pages or children are fetched.
+    content_size = 0
+    incomplete = False
+
+    async def request_blocks(block_id: str, params: dict) -> dict:
+        """Fetch one page of a block's children."""
+        async with _block_fetch_slots:
+            response = await client.get(f"/blocks/{block_id}/children", params=params)
+        response.raise_for_status()
+        return _decode(response)
+
     async def fetch_blocks(block_id: str, cursor: str | None = None) -> list[dict]:
         """Fetch blocks for a given parent, handling pagination."""
+        nonlocal content_size, incomplete
         all_blocks = []
         params = {"page_size": page_size}
         if cursor:
             params["start_cursor"] = cursor
 
+        data = await request_blocks(block_id, params)
         while True:
-            response = await client.get(f"/blocks/{block_id}/children", params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            for block in data.get("results", []):
-                formatted = format_block(block)
-                # Recursively fetch children if fetch_all and has_children
-                if fetch_all and block.get("has_children"):
-                    formatted["children"] = await fetch_blocks(block["id"])
-                all_blocks.append(formatted)
+            results = data.get("results", [])
+            page_blocks = [format_block(block) for block in results]
+            all_blocks.extend(page_blocks)
+            content_size += sum(len(orjson.dumps(formatted)) for formatted in page_blocks)
+            if content_size > MAX_TEXT_SIZE:
+                # Only flag it if stopping here skips further pages or children
+                if data.get("has_more") or any(block.get("has_children") for block in results):
+                    incomplete = True
+                break
 
-            if not fetch_all or not data.get("has_more"):
+            # Request the next page while this page's children are fetched
+            next_page = None
+            if data.get("has_more"):
+                params["start_cursor"] = data.get("next_cursor")
+                next_page = asyncio.ensure_future(request_blocks(block_id, dict(params)))
+
+            # Fetch the children of this page's nested blocks concurrently
+            parents = [
+                (formatted, block["id"])
+                for formatted, block in zip(page_blocks, results)
+                if block.get("has_children")
+            ]
+            child_fetches = [asyncio.ensure_future(fetch_blocks(child_id)) for _, child_id in parents]
+            try:
+                children = await asyncio.gather(*child_fetches)
+            except BaseException:
+                # One failed (or this fetch was cancelled): stop the rest of the
+                # subtree before the error propagates
+                for child_fetch in child_fetches:
+                    child_fetch.cancel()
+                await asyncio.gather(*child_fetches, return_exceptions=True)
+                if next_page is not None:
+                    _discard(next_page)
+                raise
+            for (formatted, _), child_blocks in zip(parents, children):
+                formatted["children"] = child_blocks
+
+            if next_page is None:
+                break
+            if content_size > MAX_TEXT_SIZE:
+                _discard(next_page)
+                incomplete = True
                 break
-            params["start_cursor"] = data.get("next_cursor")
+            data = await next_page
 
         return all_blocks
 
     if fetch_all:
         # Fetch everything including nested blocks
         blocks = await fetch_blocks(page_id)
+        if incomplete:
+            # Ahead of the blocks, so text truncation can't cut it off
+            return {
+                "content_truncated": True,
+                "truncation_note": (
+                    f"Page content exceeds {MAX_TEXT_SIZE:,} bytes; later blocks and the children of "
+                    "blocks marked has_children were not fetched. Use fetch_all=false to page through blocks, "
+                    "and notion_get_page_content on a block ID to read its children."
+                ),
+                "blocks": blocks,
+            }
         return {"blocks": blocks}
     else:
         # Single page fetch for manual pagination
@@ -751,7 +967,7 @@ async def get_page_content(client: httpx.AsyncClient, args: dict) -> dict:
 
         response = await client.get(f"/blocks/{page_id}/children", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = _decode(response)
 
         blocks = [format_block(block) for block in data.get("results", [])]
         return {
@@ -772,7 +988,7 @@ async def create_page(client: httpx.AsyncClient, args: dict) -> dict:
 
     response = await client.post("/pages", json=body)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     return {
         "id": data["id"],
@@ -784,7 +1000,7 @@ async def create_page(client: httpx.AsyncClient, args: dict) -> dict:
 
 async def update_page(client: httpx.AsyncClient, args: dict) -> dict:
     """Update a page's properties."""
-    page_id = args["page_id"].replace("-", "")
+    page_id = _clean_id(args["page_id"])
 
     body = {}
     if "properties" in args:
@@ -794,7 +1010,7 @@ async def update_page(client: httpx.AsyncClient, args: dict) -> dict:
 
     response = await client.patch(f"/pages/{page_id}", json=body)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     return {
         "id": data["id"],
@@ -806,13 +1022,13 @@ async def update_page(client: httpx.AsyncClient, args: dict) -> dict:
 
 async def append_blocks(client: httpx.AsyncClient, args: dict) -> dict:
     """Append blocks to a page or block."""
-    block_id = args["block_id"].replace("-", "")
+    block_id = _clean_id(args["block_id"])
 
     body = {"children": args["children"]}
 
     response = await client.patch(f"/blocks/{block_id}/children", json=body)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     return {
         "results": data.get("results", []),
@@ -822,7 +1038,7 @@ async def append_blocks(client: httpx.AsyncClient, args: dict) -> dict:
 
 async def update_block(client: httpx.AsyncClient, args: dict) -> dict:
     """Update a block."""
-    block_id = args["block_id"].replace("-", "")
+    block_id = _clean_id(args["block_id"])
 
     body = {}
     if "block_content" in args:
@@ -832,7 +1048,7 @@ async def update_block(client: httpx.AsyncClient, args: dict) -> dict:
 
     response = await client.patch(f"/blocks/{block_id}", json=body)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     return {
         "id": data["id"],
@@ -851,10 +1067,10 @@ async def list_users(client: httpx.AsyncClient, args: dict) -> dict:
 
     response = await client.get("/users", params=params)
     response.raise_for_status()
-    data = response.json()
+    data = _decode(response)
 
     return {
-        "users": [format_user(u) for u in data.get("results", [])[:MAX_LIST_ITEMS]],
+        "users": [format_user(u) for u in itertools.islice(data.get("results", []), MAX_LIST_ITEMS)],
         "has_more": data.get("has_more", False),
         "next_cursor": data.get("next_cursor")
     }
@@ -862,21 +1078,27 @@ async def list_users(client: httpx.AsyncClient, args: dict) -> dict:
 
 async def get_user(client: httpx.AsyncClient, args: dict) -> dict:
     """Get a specific user."""
-    user_id = args["user_id"].replace("-", "")
+    user_id = _clean_id(args["user_id"])
     response = await client.get(f"/users/{user_id}")
     response.raise_for_status()
-    return format_user(response.json())
+    return format_user(_decode(response))
 
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        await close_clients()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())